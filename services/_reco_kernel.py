@@ -0,0 +1,102 @@
+"""
+Recommendation Scoring Kernel
+Fused hot/value/avoid pick selection for PlayerRecommendationService
+"""
+
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+def _score_all_loop(form, transfers_in, transfers_out, points_per_game,
+                    now_cost, total_points, ownership) -> Tuple[int, int, int]:
+    """
+    Single pass over active players tracking the best hot, value and avoid pick
+    
+    Arrays must already be filtered to players with enough minutes. Strict
+    ">" keeps the first of equal scores, matching argmax.
+    
+    Returns:
+        (hot_idx, value_idx, avoid_idx), -1 where no player qualifies
+    """
+    hot_idx = -1
+    value_idx = -1
+    avoid_idx = -1
+    best_hot = 0.0
+    best_value = 0.0
+    best_avoid = 0.0
+    
+    for i in range(form.shape[0]):
+        form_i = form[i]
+        ownership_change = transfers_in[i] - transfers_out[i]
+        cost = now_cost[i] / 10
+        ownership_i = ownership[i]
+        
+        # HOT PICK: High form + rising ownership + good recent points
+        if form_i > 6.0 and ownership_change > 0 and points_per_game[i] > 4.0:
+            score = form_i * 0.4 + (ownership_change / 10000) * 0.3 + points_per_game[i] * 0.3
+            if hot_idx < 0 or score > best_hot:
+                best_hot = score
+                hot_idx = i
+        
+        # VALUE PICK: High points per million + low ownership
+        if cost > 4.0 and total_points[i] > 30:
+            ownership_bonus = max(0.0, (10 - ownership_i) / 10) if ownership_i < 10 else 0.0
+            score = total_points[i] / cost + ownership_bonus
+            if value_idx < 0 or score > best_value:
+                best_value = score
+                value_idx = i
+        
+        # AVOID PICK: Poor form + high ownership + expensive
+        if cost > 8.0 and ownership_i > 15.0:
+            score = (5 - form_i) + (transfers_out[i] / 10000) + (ownership_i / 50)
+            if avoid_idx < 0 or score > best_avoid:
+                best_avoid = score
+                avoid_idx = i
+    
+    return hot_idx, value_idx, avoid_idx
+
+
+def _score_all_numpy(form, transfers_in, transfers_out, points_per_game,
+                     now_cost, total_points, ownership) -> Tuple[int, int, int]:
+    """Vectorized equivalent of _score_all_loop, used when numba is unavailable"""
+    ownership_change = transfers_in - transfers_out
+    cost = now_cost / 10
+    
+    hot_mask = (form > 6.0) & (ownership_change > 0) & (points_per_game > 4.0)
+    hot_scores = form * 0.4 + (ownership_change / 10000) * 0.3 + points_per_game * 0.3
+    
+    value_mask = (cost > 4.0) & (total_points > 30)
+    ppm = np.divide(total_points, cost, out=np.zeros_like(cost), where=cost > 0)
+    ownership_bonus = np.where(ownership < 10, np.maximum(0, (10 - ownership) / 10), 0)
+    value_scores = ppm + ownership_bonus
+    
+    avoid_mask = (cost > 8.0) & (ownership > 15.0)
+    avoid_scores = (5 - form) + (transfers_out / 10000) + (ownership / 50)
+    
+    return (
+        _masked_argmax(hot_scores, hot_mask),
+        _masked_argmax(value_scores, value_mask),
+        _masked_argmax(avoid_scores, avoid_mask)
+    )
+
+
+def _masked_argmax(scores: np.ndarray, mask: np.ndarray) -> int:
+    """Index of the highest score where mask is set, or -1"""
+    if not mask.any():
+        return -1
+    return int(np.where(mask, scores, -np.inf).argmax())
+
+
+if _NUMBA_AVAILABLE:
+    # No fastmath: reassociated float math could reorder near-equal scores.
+    # Compiled on first call, not at import; cache=True persists the machine
+    # code so later processes load it instead of recompiling
+    score_all = njit(cache=True)(_score_all_loop)
+else:
+    score_all = _score_all_numpy
@@ -4,16 +4,26 @@ Integrates injury news, press conferences, and other external data
 """
 
 import pandas as pd
-import requests
-from typing import Dict, List, Optional
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
 import logging
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
 import re
+import os
+import json
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
 
+def _last_name(name: str) -> str:
+    """Return the last token of a lower-cased name, treating "B.Fernandes" as two tokens"""
+    tokens = name.replace('.', ' ').split()
+    return tokens[-1] if tokens else ''
+
+
 class ExternalDataIntegratorService:
     """
     Integrates external data sources for enhanced FPL analysis
@@ -23,17 +33,122 @@ class ExternalDataIntegratorService:
     - Weather data (for match conditions)
     """
     
+    # Ordered so that ">= 'High'" selects High and Critical on integer codes
+    _RISK_DTYPE = pd.CategoricalDtype(['Low', 'Medium', 'High', 'Critical'], ordered=True)
+    
     def __init__(self):
         """Initialize the external data integrator"""
         self.injury_data_cache = None
         self.transfer_data_cache = None
-        self.cache_timestamp = None
-        self.cache_duration = timedelta(hours=1)  # Cache for 1 hour
+        self.injury_cache_ts = None
+        self.transfer_cache_ts = None
+        # Injury bulletins change several times per matchday, transfers rarely
+        self.ttls = {
+            'injury': timedelta(minutes=15),
+            'transfer': timedelta(hours=6)
+        }
+        self._refresh_lock = threading.Lock()
+        self._refreshing = set()
         self.injury_url = "https://www.premierleague.com/en/latest-player-injuries"
         self.transfer_url = "https://www.premierleague.com/en/transfers"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # requests is imported on first scrape, not at module load
+        self._session = None
+        self._session_lock = threading.Lock()
+        # Last page bodies and validators, so restarts can send conditional GETs
+        self.http_cache_dir = Path.home() / '.cache' / 'fpl'
+    
+    def _get_session(self):
+        """Return the shared scrape session, creating it on first use"""
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+    
+    def _create_session(self) -> 'requests.Session':
+        """Create a keep-alive session shared by the Premier League scrapes"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        
+        retry_strategy = Retry(total=3, backoff_factor=0.3)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=2,
+            pool_maxsize=4
+        )
+        session.mount("https://", adapter)
+        
+        session.headers.update(self.headers)
+        session.headers['Accept-Encoding'] = 'gzip, deflate'
+        
+        return session
+    
+    def _fetch_page(self, url: str, cache_name: str) -> bytes:
+        """
+        Fetch a page body, revalidating against the copy cached on disk
+        
+        Sends If-None-Match/If-Modified-Since when a cached copy exists and
+        reuses it on 304 Not Modified; otherwise stores the new body.
+        
+        Args:
+            url: Page URL
+            cache_name: File stem for the cached body and its metadata
+            
+        Returns:
+            Raw page content
+        """
+        body_path = self.http_cache_dir / f"{cache_name}.html"
+        meta_path = self.http_cache_dir / f"{cache_name}.html.meta"
+        
+        conditional_headers = {}
+        if body_path.exists() and meta_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                meta = {}
+            if meta.get('etag'):
+                conditional_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                conditional_headers['If-Modified-Since'] = meta['last_modified']
+        
+        session = self._get_session()
+        response = session.get(url, headers=conditional_headers, timeout=10)
+        
+        if response.status_code == 304:
+            try:
+                logger.info(f"{url} not modified, using cached page")
+                return body_path.read_bytes()
+            except OSError:
+                # Cached body vanished; fetch unconditionally
+                response = session.get(url, timeout=10)
+        
+        response.raise_for_status()
+        self._store_page(body_path, meta_path, response)
+        return response.content
+    
+    def _store_page(self, body_path: Path, meta_path: Path, response) -> None:
+        """Atomically persist a page body and its cache validators"""
+        meta = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+        if not meta['etag'] and not meta['last_modified']:
+            return
+        
+        try:
+            body_path.parent.mkdir(parents=True, exist_ok=True)
+            for path, data in ((body_path, response.content),
+                               (meta_path, json.dumps(meta).encode('utf-8'))):
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write page cache {body_path}: {e}")
     
     def get_injury_news(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -48,6 +163,10 @@ class ExternalDataIntegratorService:
         """
         df = df.copy()
         
+        # Status has a handful of codes; categorical comparisons run on int codes
+        if 'status' in df.columns:
+            df['status'] = df['status'].astype('category')
+        
         # Fetch real injury data from Premier League
         try:
             pl_injuries = self.fetch_premier_league_injuries()
@@ -57,24 +176,33 @@ class ExternalDataIntegratorService:
             for injury in pl_injuries:
                 injury_map[injury['player_name'].lower()] = injury
             
+            # Index injuries by last name for the fallback match; first entry wins
+            last_name_map = {}
+            for inj_name, injury in injury_map.items():
+                last_name = _last_name(inj_name)
+                if last_name:
+                    last_name_map.setdefault(last_name, injury)
+            
             # Add Premier League injury data to dataframe
             df['pl_injury_status'] = None
             df['pl_expected_return'] = None
             
             if 'web_name' in df.columns:
-                for idx, row in df.iterrows():
-                    player_name = str(row['web_name']).lower()
-                    # Try exact match first
-                    if player_name in injury_map:
-                        df.at[idx, 'pl_injury_status'] = injury_map[player_name]['injury_status']
-                        df.at[idx, 'pl_expected_return'] = injury_map[player_name]['expected_return']
-                    else:
-                        # Try partial match (last name)
-                        for inj_name in injury_map.keys():
-                            if player_name in inj_name or inj_name in player_name:
-                                df.at[idx, 'pl_injury_status'] = injury_map[inj_name]['injury_status']
-                                df.at[idx, 'pl_expected_return'] = injury_map[inj_name]['expected_return']
-                                break
+                # Lower-case names once per call, as plain strings (NaN -> 'nan')
+                player_names = [str(name).lower() for name in df['web_name'].tolist()]
+                
+                injury_statuses = []
+                expected_returns = []
+                for player_name in player_names:
+                    # Try exact match first, then last name
+                    match = injury_map.get(player_name)
+                    if match is None:
+                        match = last_name_map.get(_last_name(player_name))
+                    injury_statuses.append(match['injury_status'] if match else None)
+                    expected_returns.append(match['expected_return'] if match else None)
+                
+                df['pl_injury_status'] = pd.Categorical(injury_statuses)
+                df['pl_expected_return'] = expected_returns
         except Exception as e:
             logger.warning(f"Could not fetch Premier League injury data: {e}")
         
@@ -96,7 +224,11 @@ class ExternalDataIntegratorService:
         
         # Factor 3: News indicator
         if 'news' in df.columns:
-            has_news = df['news'].str.len() > 0
+            news_vals = df['news'].tolist()
+            has_news = np.fromiter(
+                (isinstance(v, str) and len(v) > 0 for v in news_vals),
+                dtype=bool, count=len(news_vals)
+            )
             df.loc[has_news, 'injury_risk_score'] += 3
         
         # Factor 4: Status (injured, suspended, etc.)
@@ -112,10 +244,11 @@ class ExternalDataIntegratorService:
             df.loc[has_pl_injury, 'injury_risk_score'] += 5
         
         # Categorize injury risk
-        df['injury_risk_category'] = 'Low'
-        df.loc[df['injury_risk_score'] > 5, 'injury_risk_category'] = 'Medium'
-        df.loc[df['injury_risk_score'] > 10, 'injury_risk_category'] = 'High'
-        df.loc[df['injury_risk_score'] > 15, 'injury_risk_category'] = 'Critical'
+        df['injury_risk_category'] = pd.cut(
+            df['injury_risk_score'],
+            bins=[-np.inf, 5, 10, 15, np.inf],
+            labels=list(self._RISK_DTYPE.categories)
+        ).astype(self._RISK_DTYPE).fillna('Low')
         
         # Add injury impact on ownership
         if 'selected_by_percent' in df.columns:
@@ -137,26 +270,76 @@ class ExternalDataIntegratorService:
         """
         df = self.get_injury_news(df)
         
-        alerts = []
-        
         # Alert for high-risk, high-ownership players
         high_risk = df[
-            (df['injury_risk_category'].isin(['High', 'Critical'])) &
+            (df['injury_risk_category'] >= 'High') &
             (df.get('selected_by_percent', 0) > 10)
         ]
         
-        for _, player in high_risk.iterrows():
-            alerts.append({
-                'player_name': player.get('web_name', 'Unknown'),
-                'risk_level': player['injury_risk_category'],
-                'ownership': player.get('selected_by_percent', 0),
-                'news': player.get('news', 'No details available'),
-                'chance_of_playing': player.get('chance_of_playing_next_round', 100),
-                'alert_type': 'injury',
-                'urgency': 'high' if player['injury_risk_score'] > 15 else 'medium'
-            })
-        
-        return alerts
+        alerts = pd.DataFrame({
+            'player_name': high_risk.get('web_name', 'Unknown'),
+            'risk_level': high_risk['injury_risk_category'],
+            'ownership': high_risk.get('selected_by_percent', 0),
+            'news': high_risk.get('news', 'No details available'),
+            'chance_of_playing': high_risk.get('chance_of_playing_next_round', 100),
+            'alert_type': 'injury',
+            'urgency': np.where(high_risk['injury_risk_score'] > 15, 'high', 'medium')
+        }, index=high_risk.index)
+        
+        return alerts.to_dict('records')
+    
+    def _get_cached(self, source: str, cache: Optional[List[Dict]],
+                    cache_ts: Optional[datetime],
+                    refresh: Callable[[], List[Dict]]) -> Optional[List[Dict]]:
+        """
+        Return cached data for a source using stale-while-revalidate semantics
+        
+        Fresh data (younger than the source TTL) is returned as-is. Stale data
+        younger than twice the TTL is returned immediately while a background
+        refresh runs. Anything older returns None so the caller refreshes
+        synchronously.
+        
+        Args:
+            source: Cache key in self.ttls ('injury' or 'transfer')
+            cache: Cached records for the source
+            cache_ts: When the cache was last filled
+            refresh: Callable that re-scrapes and refills the cache
+            
+        Returns:
+            Cached records, or None if a synchronous refresh is required
+        """
+        if not cache or not cache_ts:
+            return None
+        
+        age = datetime.now() - cache_ts
+        ttl = self.ttls[source]
+        
+        if age < ttl:
+            logger.info(f"Returning cached {source} data")
+            return cache
+        
+        if age < 2 * ttl:
+            logger.info(f"Returning stale {source} data, refreshing in background")
+            self._start_background_refresh(source, refresh)
+            return cache
+        
+        return None
+    
+    def _start_background_refresh(self, source: str, refresh: Callable[[], List[Dict]]) -> None:
+        """Run a refresh on a daemon thread unless one is already in flight"""
+        with self._refresh_lock:
+            if source in self._refreshing:
+                return
+            self._refreshing.add(source)
+        
+        def run():
+            try:
+                refresh()
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(source)
+        
+        threading.Thread(target=run, daemon=True).start()
     
     def fetch_premier_league_injuries(self) -> List[Dict]:
         """
@@ -165,18 +348,24 @@ class ExternalDataIntegratorService:
         Returns:
             List of injury dictionaries with player name, team, and status
         """
-        # Check cache first
-        if self.injury_data_cache and self.cache_timestamp:
-            if datetime.now() - self.cache_timestamp < self.cache_duration:
-                logger.info("Returning cached injury data")
-                return self.injury_data_cache
+        cached = self._get_cached(
+            'injury', self.injury_data_cache, self.injury_cache_ts, self._refresh_injuries
+        )
+        if cached is not None:
+            return cached
+        
+        return self._refresh_injuries()
+    
+    def _refresh_injuries(self) -> List[Dict]:
+        """Scrape the injury page and update the injury cache"""
+        import requests
+        from bs4 import BeautifulSoup
         
         try:
             logger.info(f"Fetching injury data from {self.injury_url}")
-            response = requests.get(self.injury_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            content = self._fetch_page(self.injury_url, 'injuries')
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(content, 'html.parser')
             injuries = []
             
             # Parse the injury table
@@ -228,7 +417,7 @@ class ExternalDataIntegratorService:
             # Cache the results
             if injuries:
                 self.injury_data_cache = injuries
-                self.cache_timestamp = datetime.now()
+                self.injury_cache_ts = datetime.now()
                 logger.info(f"Successfully fetched {len(injuries)} injury records")
             else:
                 logger.warning("No injury data found - check website structure")
@@ -251,18 +440,24 @@ class ExternalDataIntegratorService:
         Returns:
             List of transfer dictionaries with player, clubs, and transfer details
         """
-        # Check cache first
-        if self.transfer_data_cache and self.cache_timestamp:
-            if datetime.now() - self.cache_timestamp < self.cache_duration:
-                logger.info("Returning cached transfer data")
-                return self.transfer_data_cache
+        cached = self._get_cached(
+            'transfer', self.transfer_data_cache, self.transfer_cache_ts, self._refresh_transfers
+        )
+        if cached is not None:
+            return cached
+        
+        return self._refresh_transfers()
+    
+    def _refresh_transfers(self) -> List[Dict]:
+        """Scrape the transfer page and update the transfer cache"""
+        import requests
+        from bs4 import BeautifulSoup
         
         try:
             logger.info(f"Fetching transfer data from {self.transfer_url}")
-            response = requests.get(self.transfer_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            content = self._fetch_page(self.transfer_url, 'transfers')
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(content, 'html.parser')
             transfers = []
             
             # Parse the transfer table
@@ -323,7 +518,7 @@ class ExternalDataIntegratorService:
             # Cache the results
             if transfers:
                 self.transfer_data_cache = transfers
-                self.cache_timestamp = datetime.now()
+                self.transfer_cache_ts = datetime.now()
                 logger.info(f"Successfully fetched {len(transfers)} transfer records")
             else:
                 logger.warning("No transfer data found - check website structure")
@@ -337,7 +532,19 @@ class ExternalDataIntegratorService:
             logger.error(f"Error parsing transfer data: {e}")
             return self.transfer_data_cache if self.transfer_data_cache else []
     
-    def get_injury_news(self, df: pd.DataFrame) -> pd.DataFrame:
+    def fetch_all(self) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Fetch injury and transfer data concurrently
+        
+        Returns:
+            Tuple of (injuries, transfers) lists
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            injuries_future = executor.submit(self.fetch_premier_league_injuries)
+            transfers_future = executor.submit(self.fetch_premier_league_transfers)
+            return injuries_future.result(), transfers_future.result()
+    
+    def get_press_conference_insights(self) -> List[Dict]:
         """
         Get simulated press conference insights
         (In production, this would scrape from official sources)
@@ -444,19 +651,40 @@ class ExternalDataIntegratorService:
         
         Args:
             team_id: FPL team ID
-            df: Player dataframe
+            df: Player dataframe, enriched by get_injury_news or raw
+            
+        Returns:
+            Team news summary dictionary
+        """
+        if 'injury_risk_category' not in df.columns:
+            # Enrich only this team's players; multi-team callers should
+            # enrich once and use summarize_team/get_all_team_news_summaries
+            df = self.get_injury_news(df[df['team'] == team_id])
+        
+        return self.summarize_team(team_id, df)
+    
+    def summarize_team(self, team_id: int, enriched_df: pd.DataFrame) -> Dict:
+        """
+        Summarize team news from a frame already enriched by get_injury_news
+        
+        Enrich the full player frame once and call this per team rather than
+        re-running the enrichment for every team subset.
+        
+        Args:
+            team_id: FPL team ID
+            enriched_df: Player dataframe returned by get_injury_news
             
         Returns:
             Team news summary dictionary
         """
-        team_players = df[df['team'] == team_id].copy()
-        team_players = self.get_injury_news(team_players)
+        team_players = enriched_df[enriched_df['team'] == team_id]
         
         # Count players by injury risk
-        risk_counts = team_players['injury_risk_category'].value_counts().to_dict()
+        risk_counts = team_players['injury_risk_category'].value_counts()
+        risk_counts = risk_counts[risk_counts > 0].to_dict()
         
         # Get injured players
-        injured = team_players[team_players['injury_risk_category'].isin(['High', 'Critical'])]
+        injured = team_players[team_players['injury_risk_category'] >= 'High']
         
         # Calculate team availability
         total_players = len(team_players)
@@ -473,6 +701,61 @@ class ExternalDataIntegratorService:
             'summary': f"{available_players}/{total_players} players available ({round(availability_percentage, 1)}%)"
         }
     
+    def get_all_team_news_summaries(self, df: pd.DataFrame) -> Dict[int, Dict]:
+        """
+        Get team news summaries for every team from a single groupby
+        
+        Args:
+            df: Player dataframe, enriched by get_injury_news or raw
+            
+        Returns:
+            Dictionary of team news summaries keyed by team ID
+        """
+        if 'injury_risk_category' not in df.columns:
+            df = self.get_injury_news(df)
+        
+        # One hashed pass gives the risk distribution of every team
+        counts = (
+            df.groupby('team', observed=True)['injury_risk_category']
+            .value_counts()
+            .unstack(fill_value=0)
+            .reindex(columns=['Low', 'Medium', 'High', 'Critical'], fill_value=0)
+        )
+        totals = counts.sum(axis=1)
+        availability = (counts['Low'] / totals * 100).round(1)
+        
+        injured = df[df['injury_risk_category'] >= 'High']
+        injured_by_team = {
+            team_id: group[['web_name', 'injury_risk_category', 'news']].to_dict('records')
+            for team_id, group in injured.groupby('team', observed=True)
+        }
+        
+        team_stats = pd.DataFrame({
+            'total_players': totals,
+            'available_players': counts['Low'],
+            'availability_percentage': availability
+        }).to_dict('index')
+        distributions = counts.to_dict('index')
+        
+        summaries = {}
+        for team_id, stats in team_stats.items():
+            available_players = stats['available_players']
+            total_players = stats['total_players']
+            availability_percentage = stats['availability_percentage']
+            summaries[team_id] = {
+                'team_id': team_id,
+                'total_players': total_players,
+                'available_players': available_players,
+                'availability_percentage': availability_percentage,
+                'risk_distribution': {
+                    category: count for category, count in distributions[team_id].items() if count > 0
+                },
+                'injured_players': injured_by_team.get(team_id, []),
+                'summary': f"{available_players}/{total_players} players available ({availability_percentage}%)"
+            }
+        
+        return summaries
+    
     def get_rotation_risk(self, df: pd.DataFrame, fixture_congestion: bool = False) -> pd.DataFrame:
         """
         Assess rotation risk for players
@@ -486,29 +769,27 @@ class ExternalDataIntegratorService:
         """
         df = df.copy()
         
-        df['rotation_risk'] = 0
-        
-        # Factor 1: High minutes recently (fatigue risk)
-        if 'minutes' in df.columns:
-            high_minutes = df['minutes'] > 270  # More than 3 full games
-            df.loc[high_minutes, 'rotation_risk'] += 3
+        n_players = len(df)
+        minutes = df['minutes'].to_numpy() if 'minutes' in df.columns else np.zeros(n_players)
+        age = df['age'].to_numpy() if 'age' in df.columns else np.zeros(n_players)
         
+        # Factor 1: High minutes recently (fatigue risk) - more than 3 full games
         # Factor 2: Age (older players more likely to be rested)
-        if 'age' in df.columns:
-            df.loc[df['age'] > 30, 'rotation_risk'] += 2
-            df.loc[df['age'] > 33, 'rotation_risk'] += 2
+        risk = (minutes > 270) * 3 + (age > 30) * 2 + (age > 33) * 2
         
         # Factor 3: Fixture congestion multiplier
         if fixture_congestion:
-            df['rotation_risk'] = df['rotation_risk'] * 1.5
+            risk = risk * 1.5
         
         # Factor 4: Team (some managers rotate more)
         # This would be enhanced with actual team rotation patterns
         
+        df['rotation_risk'] = risk
+        
         # Categorize rotation risk
-        df['rotation_risk_category'] = 'Low'
-        df.loc[df['rotation_risk'] > 3, 'rotation_risk_category'] = 'Medium'
-        df.loc[df['rotation_risk'] > 6, 'rotation_risk_category'] = 'High'
+        df['rotation_risk_category'] = pd.Categorical(
+            np.select([risk > 6, risk > 3], ['High', 'Medium'], default='Low')
+        )
         
         return df
     
@@ -527,25 +808,23 @@ class ExternalDataIntegratorService:
         
         # Get rotation risk
         df_with_rotation = self.get_rotation_risk(df, fixture_congestion=True)
-        rotation_alerts = []
         
         high_rotation_risk = df_with_rotation[
             (df_with_rotation['rotation_risk_category'] == 'High') &
             (df_with_rotation.get('selected_by_percent', 0) > 5)
         ]
         
-        for _, player in high_rotation_risk.iterrows():
-            rotation_alerts.append({
-                'player_name': player.get('web_name', 'Unknown'),
-                'risk_level': player['rotation_risk_category'],
-                'ownership': player.get('selected_by_percent', 0),
-                'minutes': player.get('minutes', 0),
-                'alert_type': 'rotation',
-                'urgency': 'medium'
-            })
+        rotation_alerts = pd.DataFrame({
+            'player_name': high_rotation_risk.get('web_name', 'Unknown'),
+            'risk_level': high_rotation_risk['rotation_risk_category'],
+            'ownership': high_rotation_risk.get('selected_by_percent', 0),
+            'minutes': high_rotation_risk.get('minutes', 0),
+            'alert_type': 'rotation',
+            'urgency': 'medium'
+        }, index=high_rotation_risk.index)
         
         return {
             'injury_alerts': injury_alerts,
-            'rotation_alerts': rotation_alerts,
+            'rotation_alerts': rotation_alerts.to_dict('records'),
             'press_conference_insights': self.get_press_conference_insights()
         }
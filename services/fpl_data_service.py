@@ -10,6 +10,7 @@ import urllib3
 from typing import Optional, Tuple, Dict, Any
 
 from utils.error_handling import logger
+from utils.data_converters import clean_numeric_column
 
 # Suppress warnings
 warnings.filterwarnings('ignore')
@@ -113,9 +114,17 @@ class FPLDataService:
             if players_df.empty:
                 raise ValueError("No player data available")
                 
-            # Convert numeric columns
+            # Core columns are quantized at ingestion: int16 tenths of a
+            # million / points, float32 form and ownership
+            downcast_columns = {
+                'now_cost': 'int', 'total_points': 'int',
+                'form': 'float', 'selected_by_percent': 'float'
+            }
+            for col, dtype in downcast_columns.items():
+                players_df = clean_numeric_column(players_df, col, dtype=dtype, downcast=True)
+            
+            # Convert remaining numeric columns
             numeric_columns = [
-                'total_points', 'now_cost', 'form', 'selected_by_percent', 
                 'minutes', 'goals_scored', 'assists', 'clean_sheets',
                 'bonus', 'bps', 'influence', 'creativity', 'threat', 
                 'ict_index', 'points_per_game', 'value_form', 'value_season'
@@ -4,46 +4,98 @@ Handles page navigation and routing
 """
 
 import streamlit as st
-from streamlit_option_menu import option_menu
+
+
+_PAGES = (
+    "Dashboard",
+    "Player Analysis", 
+    "Team Builder",
+    "My Team",
+    "AI Recommendations",
+    "Advanced Analytics",
+    "Fixture Analysis",
+    "Price Changes",
+    "Live Data",
+    "Market Intelligence",
+    "Injury & Transfers",
+    "Learning Resources"
+)
+
+_ICONS = (
+    "speedometer2",
+    "person-circle", 
+    "tools",
+    "trophy-fill",
+    "robot",
+    "graph-up-arrow",
+    "calendar3",
+    "cash-coin",
+    "broadcast",
+    "bar-chart-fill",
+    "hospital",
+    "book-fill"
+)
+
+_PAGE_INFO = {
+    "Dashboard": {
+        "description": "Overview of FPL performance and market intelligence",
+        "features": ["Key metrics", "Market overview", "Performance analytics"]
+    },
+    "Player Analysis": {
+        "description": "Deep dive into individual player statistics",
+        "features": ["Player search", "Performance history", "Value analysis"]
+    },
+    "Team Builder": {
+        "description": "Build and optimize your FPL team",
+        "features": ["Squad builder", "Budget management", "Formation optimizer"]
+    },
+    "My Team": {
+        "description": "Analyze your current FPL team",
+        "features": ["Team overview", "Performance analysis", "Transfer suggestions"]
+    },
+    "AI Recommendations": {
+        "description": "AI-powered player and strategy recommendations",
+        "features": ["Smart picks", "Captain suggestions", "Transfer advice"]
+    },
+    "Advanced Analytics": {
+        "description": "Advanced statistical analysis and modeling",
+        "features": ["Predictive analytics", "Historical trends", "Performance modeling"]
+    },
+    "Fixture Analysis": {
+        "description": "Comprehensive fixture difficulty analysis",
+        "features": ["Overall difficulty", "Attack analysis", "Defense analysis"]
+    },
+    "Live Data": {
+        "description": "Real-time FPL data monitoring",
+        "features": ["Live updates", "API status", "Data freshness"]
+    },
+    "Market Intelligence": {
+        "description": "Transfer market trends and price movements",
+        "features": ["Transfer trends", "Price changes", "Ownership data"]
+    },
+    "Learning Resources": {
+        "description": "FPL glossary, strategy guides, and tutorials",
+        "features": ["FPL terminology glossary", "Strategy guides for all stages", "Quick start tutorial", "External resources"]
+    }
+}
+
+_DEFAULT_INFO = {
+    "description": "Page information not available",
+    "features": []
+}
 
 
 class NavigationService:
     """Service for handling navigation and page routing"""
     
-    def __init__(self):
-        """Initialize the navigation service"""
-        self.pages = [
-            "Dashboard",
-            "Player Analysis", 
-            "Team Builder",
-            "My Team",
-            "AI Recommendations",
-            "Advanced Analytics",
-            "Fixture Analysis",
-            "Price Changes",
-            "Live Data",
-            "Market Intelligence",
-            "Injury & Transfers",
-            "Learning Resources"
-        ]
-        
-        self.icons = [
-            "speedometer2",
-            "person-circle", 
-            "tools",
-            "trophy-fill",
-            "robot",
-            "graph-up-arrow",
-            "calendar3",
-            "cash-coin",
-            "broadcast",
-            "bar-chart-fill",
-            "hospital",
-            "book-fill"
-        ]
+    # Shared by every instance; Streamlit re-creates the service on each rerun
+    pages = _PAGES
+    icons = _ICONS
     
     def render_navigation(self):
         """Render main navigation menu matching reference site structure"""
+        from streamlit_option_menu import option_menu
+        
         selected_page = option_menu(
             menu_title=None,
             options=self.pages,
@@ -78,50 +130,4 @@ class NavigationService:
     
     def get_page_info(self, page_name):
         """Get information about a specific page"""
-        page_info = {
-            "Dashboard": {
-                "description": "Overview of FPL performance and market intelligence",
-                "features": ["Key metrics", "Market overview", "Performance analytics"]
-            },
-            "Player Analysis": {
-                "description": "Deep dive into individual player statistics",
-                "features": ["Player search", "Performance history", "Value analysis"]
-            },
-            "Team Builder": {
-                "description": "Build and optimize your FPL team",
-                "features": ["Squad builder", "Budget management", "Formation optimizer"]
-            },
-            "My Team": {
-                "description": "Analyze your current FPL team",
-                "features": ["Team overview", "Performance analysis", "Transfer suggestions"]
-            },
-            "AI Recommendations": {
-                "description": "AI-powered player and strategy recommendations",
-                "features": ["Smart picks", "Captain suggestions", "Transfer advice"]
-            },
-            "Advanced Analytics": {
-                "description": "Advanced statistical analysis and modeling",
-                "features": ["Predictive analytics", "Historical trends", "Performance modeling"]
-            },
-            "Fixture Analysis": {
-                "description": "Comprehensive fixture difficulty analysis",
-                "features": ["Overall difficulty", "Attack analysis", "Defense analysis"]
-            },
-            "Live Data": {
-                "description": "Real-time FPL data monitoring",
-                "features": ["Live updates", "API status", "Data freshness"]
-            },
-            "Market Intelligence": {
-                "description": "Transfer market trends and price movements",
-                "features": ["Transfer trends", "Price changes", "Ownership data"]
-            },
-            "Learning Resources": {
-                "description": "FPL glossary, strategy guides, and tutorials",
-                "features": ["FPL terminology glossary", "Strategy guides for all stages", "Quick start tutorial", "External resources"]
-            }
-        }
-        
-        return page_info.get(page_name, {
-            "description": "Page information not available",
-            "features": []
-        })
\ No newline at end of file
+        return _PAGE_INFO.get(page_name, _DEFAULT_INFO)
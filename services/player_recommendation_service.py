@@ -3,15 +3,110 @@ Player Recommendation Service
 Handles intelligent player recommendations based on live FPL data
 """
 
+import numpy as np
 import streamlit as st
-from utils.performance_optimizer import cache_5min, measure_perf
+from operator import itemgetter
+from typing import Dict, List, Optional
+from utils.performance_optimizer import PerformanceOptimizer, cache_5min, measure_perf
+from services._reco_kernel import score_all
+
+# Numeric element fields used for scoring
+_SCORING_FIELDS = (
+    'form', 'transfers_in_event', 'transfers_out_event', 'points_per_game',
+    'now_cost', 'total_points', 'selected_by_percent', 'minutes'
+)
+
+
+def _player_columns(players: List[Dict], fields=_SCORING_FIELDS) -> Dict[str, np.ndarray]:
+    """Convert the element dicts into one float array per requested field"""
+    try:
+        # One C-level itemgetter call per player instead of a dict.get per field
+        rows = list(map(itemgetter(*fields), players))
+    except KeyError:
+        rows = [tuple(p.get(field, 0) for field in fields) for p in players]
+    
+    block = np.array(rows, dtype=np.float64).reshape(len(players), len(fields))
+    return dict(zip(fields, np.ascontiguousarray(block.T)))
+
+
+def _best_index(scores: np.ndarray, mask: np.ndarray) -> Optional[int]:
+    """Index of the highest masked score, or None when no player qualifies"""
+    if not mask.any():
+        return None
+    return int(scores.argmax())
+
+
+def _data_fingerprint(data: Dict) -> int:
+    """Hash of the element fields that change between refreshes, far cheaper than str(data)"""
+    return hash((
+        len(data.get('elements', [])),
+        data.get('last_updated'),
+        tuple(
+            (p.get('id'), p.get('transfers_in_event'), p.get('transfers_out_event'),
+             p.get('total_points'), p.get('now_cost'))
+            for p in data.get('elements', [])
+        )
+    ))
+
+
+# Fallback results, shared rather than rebuilt on every miss (callers only read them)
+_FALLBACK_RECS = {
+    'hot_pick': {'name': 'Palmer', 'reason': '+£0.1m rise due'},
+    'value_pick': {'name': 'Strand Larsen', 'reason': '5.5m, great fixtures'},
+    'avoid_pick': {'name': 'Sterling', 'reason': 'Poor form'}
+}
+_ERROR_RECS = {
+    'hot_pick': {'name': 'Palmer', 'reason': 'Analysis error'},
+    'value_pick': {'name': 'Strand Larsen', 'reason': 'Analysis error'},
+    'avoid_pick': {'name': 'Sterling', 'reason': 'Analysis error'}
+}
+_FALLBACK_STATS = {
+    'most_in': {'name': 'Palmer', 'change': '+125K this week'},
+    'most_out': {'name': 'Sterling', 'change': '-89K this week'},
+    'price_rise': {'name': 'Haaland', 'change': '+£0.2m'}
+}
+_LOADING_STATS = {
+    'most_in': {'name': 'Data Loading', 'change': '...'},
+    'most_out': {'name': 'Data Loading', 'change': '...'},
+    'price_rise': {'name': 'Data Loading', 'change': '...'}
+}
+
+
+# Keys cached calls on the payload fingerprint instead of stringifying every element
+cache_5min_by_data = PerformanceOptimizer.cache_expensive_calculation(
+    ttl=300, hash_funcs={dict: _data_fingerprint}
+)
+
 
 class PlayerRecommendationService:
     """Service for generating intelligent player recommendations"""
     
     def __init__(self):
         """Initialize the recommendation service"""
-        pass
+        # Team lookup and the teams list it was built from
+        self._teams_cache: Dict[int, Dict] = {}
+        self._teams_source: Optional[List[Dict]] = None
+        # Parsed element columns and the elements list they came from
+        self._columns_cache: Dict[str, np.ndarray] = {}
+        self._columns_source: Optional[List[Dict]] = None
+    
+    def _get_element_columns(self, data: Dict) -> Dict[str, np.ndarray]:
+        """Scoring columns for the payload's elements, parsed once per elements list"""
+        players = data.get('elements', [])
+        # Shared by recommendations, insights and transfer stats within a render
+        if players is not self._columns_source:
+            self._columns_cache = _player_columns(players)
+            self._columns_source = players
+        return self._columns_cache
+    
+    def _get_teams_lookup(self, data: Dict) -> Dict[int, Dict]:
+        """Team id -> team dict, rebuilt only when the payload's teams list changes"""
+        teams = data.get('teams', [])
+        # Identity check against a held reference, so a recycled id() can't match
+        if teams is not self._teams_source:
+            self._teams_cache = {team['id']: team for team in teams}
+            self._teams_source = teams
+        return self._teams_cache
     
     @cache_5min
     @measure_perf
@@ -20,102 +115,67 @@ class PlayerRecommendationService:
         try:
             if not isinstance(data, dict) or 'elements' not in data:
                 # Fallback recommendations
-                return {
-                    'hot_pick': {'name': 'Palmer', 'reason': '+£0.1m rise due'},
-                    'value_pick': {'name': 'Strand Larsen', 'reason': '5.5m, great fixtures'},
-                    'avoid_pick': {'name': 'Sterling', 'reason': 'Poor form'}
-                }
+                return _FALLBACK_RECS
             
             players = data.get('elements', [])
-            teams = {team['id']: team for team in data.get('teams', [])}
-            
-            # Filter players with minimum minutes played
-            active_players = [p for p in players if p.get('minutes', 0) > 200]
-            
-            # HOT PICK: High form + rising ownership + good recent points
-            hot_candidates = []
-            for player in active_players:
-                form = float(player.get('form', 0))
-                ownership_change = float(player.get('transfers_in_event', 0)) - float(player.get('transfers_out_event', 0))
-                points_per_game = float(player.get('points_per_game', 0))
-                
-                if form > 6.0 and ownership_change > 0 and points_per_game > 4.0:
-                    score = form * 0.4 + (ownership_change / 10000) * 0.3 + points_per_game * 0.3
-                    hot_candidates.append({
-                        'player': player,
-                        'score': score,
-                        'form': form,
-                        'ownership_change': ownership_change
-                    })
-            
-            # VALUE PICK: High points per million + low ownership
-            value_candidates = []
-            for player in active_players:
-                cost = player.get('now_cost', 0) / 10
-                total_points = player.get('total_points', 0)
-                ownership = float(player.get('selected_by_percent', 0))
-                
-                if cost > 4.0 and total_points > 30:  # Exclude cheap bench fodder
-                    ppm = total_points / cost if cost > 0 else 0
-                    # Bonus for low ownership (under 10%)
-                    ownership_bonus = max(0, (10 - ownership) / 10) if ownership < 10 else 0
-                    
-                    value_score = ppm + ownership_bonus
-                    value_candidates.append({
-                        'player': player,
-                        'score': value_score,
-                        'ppm': ppm,
-                        'cost': cost,
-                        'ownership': ownership
-                    })
-            
-            # AVOID PICK: Poor form + high ownership + expensive
-            avoid_candidates = []
-            for player in active_players:
-                form = float(player.get('form', 0))
-                cost = player.get('now_cost', 0) / 10
-                ownership = float(player.get('selected_by_percent', 0))
-                transfers_out = float(player.get('transfers_out_event', 0))
-                
-                if cost > 8.0 and ownership > 15.0:  # Only expensive, popular players
-                    avoid_score = (5 - form) + (transfers_out / 10000) + (ownership / 50)
-                    avoid_candidates.append({
-                        'player': player,
-                        'score': avoid_score,
-                        'form': form,
-                        'transfers_out': transfers_out
-                    })
-            
-            # Get best candidates
-            hot_pick = max(hot_candidates, key=lambda x: x['score']) if hot_candidates else None
-            value_pick = max(value_candidates, key=lambda x: x['score']) if value_candidates else None
-            avoid_pick = max(avoid_candidates, key=lambda x: x['score']) if avoid_candidates else None
+            if not players:
+                return _FALLBACK_RECS
+            cols = _self._get_element_columns(data)
+            
+            # Filter players with minimum minutes played, once for all three picks
+            active = np.flatnonzero(cols['minutes'] > 200)
+            if not active.size:
+                return _FALLBACK_RECS
+            active_cols = {field: values[active] for field, values in cols.items()}
+            
+            # Hot, value and avoid picks in one fused pass (-1 when none qualify)
+            picks = score_all(
+                active_cols['form'],
+                active_cols['transfers_in_event'],
+                active_cols['transfers_out_event'],
+                active_cols['points_per_game'],
+                active_cols['now_cost'],
+                active_cols['total_points'],
+                active_cols['selected_by_percent']
+            )
+            hot_idx, value_idx, avoid_idx = (int(active[pick]) if pick >= 0 else -1 for pick in picks)
+            
+            form = cols['form']
+            cost = cols['now_cost'] / 10
             
             return {
                 'hot_pick': {
-                    'name': hot_pick['player']['web_name'] if hot_pick else 'Palmer',
-                    'reason': f"Form: {hot_pick['form']:.1f}" if hot_pick else '+£0.1m rise due'
-                },
+                    'name': players[hot_idx]['web_name'],
+                    'reason': f"Form: {form[hot_idx]:.1f}"
+                } if hot_idx >= 0 else _FALLBACK_RECS['hot_pick'],
                 'value_pick': {
-                    'name': value_pick['player']['web_name'] if value_pick else 'Strand Larsen',
-                    'reason': f"£{value_pick['cost']:.1f}m, {value_pick['ppm']:.1f} PPM" if value_pick else '5.5m, great fixtures'
-                },
+                    'name': players[value_idx]['web_name'],
+                    'reason': f"£{cost[value_idx]:.1f}m, {cols['total_points'][value_idx] / cost[value_idx]:.1f} PPM"
+                } if value_idx >= 0 else _FALLBACK_RECS['value_pick'],
                 'avoid_pick': {
-                    'name': avoid_pick['player']['web_name'] if avoid_pick else 'Sterling',
-                    'reason': f"Form: {avoid_pick['form']:.1f}" if avoid_pick else 'Poor form'
-                }
+                    'name': players[avoid_idx]['web_name'],
+                    'reason': f"Form: {form[avoid_idx]:.1f}"
+                } if avoid_idx >= 0 else _FALLBACK_RECS['avoid_pick']
             }
             
         except Exception as e:
             # Fallback on any error
-            return {
-                'hot_pick': {'name': 'Palmer', 'reason': 'Analysis error'},
-                'value_pick': {'name': 'Strand Larsen', 'reason': 'Analysis error'},
-                'avoid_pick': {'name': 'Sterling', 'reason': 'Analysis error'}
-            }
+            return _ERROR_RECS
     
     def generate_market_insights(self, data, recommendations):
         """Generate market insights based on live data and recommendations"""
+        try:
+            recommendation_key = tuple(
+                (recommendations[pick]['name'], recommendations[pick]['reason'])
+                for pick in ('hot_pick', 'value_pick', 'avoid_pick')
+            )
+        except (TypeError, KeyError):
+            recommendation_key = None
+        return self._generate_market_insights(data, recommendation_key)
+    
+    @cache_5min_by_data
+    def _generate_market_insights(_self, data, recommendation_key):
+        """Build market insights from data and (name, reason) pairs for hot/value/avoid picks"""
         try:
             if not isinstance(data, dict) or 'elements' not in data:
                 return [
@@ -127,34 +187,37 @@ class PlayerRecommendationService:
                 ]
             
             players = data.get('elements', [])
-            teams = {team['id']: team for team in data.get('teams', [])}
+            teams = _self._get_teams_lookup(data)
             
             # Generate insights based on live data
             insights = []
             
+            (hot_name, hot_reason), (value_name, value_reason), (avoid_name, avoid_reason) = recommendation_key
+            
             # Hot pick insight
-            hot_name = recommendations['hot_pick']['name']
-            insights.append(f"🔥 **{hot_name}** trending upward - {recommendations['hot_pick']['reason']}")
+            insights.append(f"🔥 **{hot_name}** trending upward - {hot_reason}")
             
             # Value pick insight
-            value_name = recommendations['value_pick']['name']
-            insights.append(f"💎 **{value_name}** excellent value - {recommendations['value_pick']['reason']}")
+            insights.append(f"💎 **{value_name}** excellent value - {value_reason}")
             
             # Avoid pick insight
-            avoid_name = recommendations['avoid_pick']['name']
-            insights.append(f"⚠️ **{avoid_name}** consider transferring out - {recommendations['avoid_pick']['reason']}")
+            insights.append(f"⚠️ **{avoid_name}** consider transferring out - {avoid_reason}")
+            
+            cols = _self._get_element_columns(data)
+            total_points = cols['total_points']
+            cost = cols['now_cost'] / 10
             
             # Top scorer insight
-            top_scorer = max(players, key=lambda x: x.get('total_points', 0))
+            top_scorer = players[int(total_points.argmax())]
             team_name = teams.get(top_scorer.get('team'), {}).get('short_name', 'Unknown')
             insights.append(f"🎯 **{top_scorer['web_name']}** leading scorer with {top_scorer['total_points']} points ({team_name})")
             
             # Budget option insight
-            budget_players = [p for p in players if 4.0 <= (p.get('now_cost', 0) / 10) <= 6.0 and p.get('total_points', 0) > 50]
-            if budget_players:
-                best_budget = max(budget_players, key=lambda x: x.get('total_points', 0) / (x.get('now_cost', 1) / 10))
-                price = best_budget.get('now_cost', 0) / 10
-                insights.append(f"💰 **{best_budget['web_name']}** great budget option at £{price:.1f}m")
+            budget = (cost >= 4.0) & (cost <= 6.0) & (total_points > 50)
+            budget_idx = _best_index(np.where(budget, total_points / np.maximum(cost, 0.1), -np.inf), budget)
+            if budget_idx is not None:
+                best_budget = players[budget_idx]
+                insights.append(f"💰 **{best_budget['web_name']}** great budget option at £{cost[budget_idx]:.1f}m")
             
             return insights
             
@@ -165,35 +228,36 @@ class PlayerRecommendationService:
                 "⚡ **Data processing** - Real-time recommendations incoming"
             ]
     
-    def get_transfer_statistics(self, data):
+    @cache_5min_by_data
+    def get_transfer_statistics(_self, data):
         """Get transfer statistics from live data"""
         try:
             if not isinstance(data, dict) or 'elements' not in data:
-                return {
-                    'most_in': {'name': 'Palmer', 'change': '+125K this week'},
-                    'most_out': {'name': 'Sterling', 'change': '-89K this week'},
-                    'price_rise': {'name': 'Haaland', 'change': '+£0.2m'}
-                }
+                return _FALLBACK_STATS
             
             players = data.get('elements', [])
+            if not players:
+                return _LOADING_STATS
+            
+            cols = _self._get_element_columns(data)
+            transfers_in_event = cols['transfers_in_event']
+            transfers_out_event = cols['transfers_out_event']
             
             # Most transferred in
-            most_in = max(players, key=lambda x: float(x.get('transfers_in_event', 0)))
-            transfers_in = int(float(most_in.get('transfers_in_event', 0)))
+            most_in_idx = int(transfers_in_event.argmax())
+            most_in = players[most_in_idx]
+            transfers_in = int(transfers_in_event[most_in_idx])
             
             # Most transferred out
-            most_out = max(players, key=lambda x: float(x.get('transfers_out_event', 0)))
-            transfers_out = int(float(most_out.get('transfers_out_event', 0)))
+            most_out_idx = int(transfers_out_event.argmax())
+            most_out = players[most_out_idx]
+            transfers_out = int(transfers_out_event[most_out_idx])
             
             # Biggest price change (simulate based on transfers)
-            price_candidates = []
-            for player in players:
-                net_transfers = float(player.get('transfers_in_event', 0)) - float(player.get('transfers_out_event', 0))
-                if net_transfers > 50000:  # Significant net transfers
-                    price_candidates.append({'player': player, 'net': net_transfers})
-            
-            price_leader = max(price_candidates, key=lambda x: x['net']) if price_candidates else most_in
-            price_leader_player = price_leader['player'] if isinstance(price_leader, dict) else price_leader
+            net_transfers = transfers_in_event - transfers_out_event
+            significant = net_transfers > 50000  # Significant net transfers
+            price_leader_idx = _best_index(np.where(significant, net_transfers, -np.inf), significant)
+            price_leader_player = players[price_leader_idx] if price_leader_idx is not None else most_in
             
             return {
                 'most_in': {
@@ -211,8 +275,4 @@ class PlayerRecommendationService:
             }
             
         except Exception as e:
-            return {
-                'most_in': {'name': 'Data Loading', 'change': '...'},
-                'most_out': {'name': 'Data Loading', 'change': '...'},
-                'price_rise': {'name': 'Data Loading', 'change': '...'}
-            }
\ No newline at end of file
+            return _LOADING_STATS
\ No newline at end of file
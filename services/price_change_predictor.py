@@ -11,11 +11,18 @@ Example:
     >>> predictor = PriceChangePredictor()
     >>> predictions = predictor.predict_price_changes(players_df)
 """
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional
 from datetime import datetime
 from utils.error_handling import logger
 
+try:
+    import numexpr
+    _NUMEXPR_AVAILABLE = True
+except ImportError:
+    _NUMEXPR_AVAILABLE = False
+
 
 class PriceChangePredictor:
     """
@@ -38,6 +45,19 @@ class PriceChangePredictor:
     HIGH_OWNERSHIP = 10.0  # %
     LOW_OWNERSHIP = 2.0    # %
     
+    # Columns coerced before prediction, with their working dtypes
+    # (cost is whole tenths of a million, percent/form carry one decimal)
+    NUMERIC_COLUMNS = {
+        'transfers_in_event': np.float64,
+        'transfers_out_event': np.float64,
+        'selected_by_percent': np.float32,
+        'form': np.float32,
+        'now_cost': np.int16
+    }
+    
+    # Display line: emoji, name, thousands of net transfers, label
+    DISPLAY_FORMAT = "{} {} - {}K net ({})"
+    
     def __init__(self):
         """Initialize the price change predictor."""
         self.logger = logger
@@ -67,15 +87,21 @@ class PriceChangePredictor:
             if not all(col in df.columns for col in required_cols):
                 raise ValueError(f"Missing required columns: {required_cols}")
             
-            # Calculate net transfers
-            df = df.copy()
-            df['net_transfers'] = (
-                pd.to_numeric(df['transfers_in_event'], errors='coerce').fillna(0) -
-                pd.to_numeric(df['transfers_out_event'], errors='coerce').fillna(0)
-            )
+            # Coerce numeric inputs once so every later step works on compact typed arrays
+            numeric_cols = {
+                col: pd.to_numeric(df[col], errors='coerce').fillna(0).astype(dtype)
+                for col, dtype in self.NUMERIC_COLUMNS.items()
+                if col in df.columns
+            }
             
-            # Calculate price change probability
-            df['change_probability'] = self._calculate_change_probability(df)
+            # A single assign builds the working frame; the caller's df is untouched
+            df = df.assign(
+                **numeric_cols,
+                # Calculate net transfers
+                net_transfers=lambda d: d['transfers_in_event'].to_numpy() - d['transfers_out_event'].to_numpy(),
+                # Calculate price change probability
+                change_probability=self._calculate_change_probability
+            )
             
             # Categorize players
             risers = self._identify_risers(df, include_probable)
@@ -113,34 +139,52 @@ class PriceChangePredictor:
         Returns:
             Series with probability percentages
         """
-        net = df['net_transfers']
-        ownership = pd.to_numeric(df.get('selected_by_percent', 0), errors='coerce').fillna(0)
-        form = pd.to_numeric(df.get('form', 0), errors='coerce').fillna(0)
-        
-        # Base probability from net transfers
-        base_prob = (abs(net) / 150000 * 100).clip(0, 100)
-        
-        # Ownership modifier
-        ownership_mod = 1.0
-        for idx in df.index:
-            if net[idx] > 0:  # Rising
-                # High ownership makes rises more likely
-                if ownership[idx] > self.HIGH_OWNERSHIP:
-                    ownership_mod = 1.2
-                elif ownership[idx] < self.LOW_OWNERSHIP:
-                    ownership_mod = 0.8
-            else:  # Falling
-                # Low ownership makes falls more likely
-                if ownership[idx] < self.LOW_OWNERSHIP:
-                    ownership_mod = 1.2
-                elif ownership[idx] > self.HIGH_OWNERSHIP:
-                    ownership_mod = 0.8
+        net = df['net_transfers'].to_numpy()
+        ownership = self._column_values(df, 'selected_by_percent')
+        form = self._column_values(df, 'form')
+        
+        # Base probability from net transfers (never negative, so only cap at 100)
+        base_prob = np.abs(net) / 150000 * 100
+        np.minimum(base_prob, 100, out=base_prob)
+        
+        # Ownership modifier, per player
+        rising = net > 0
+        # High ownership makes rises more likely, low ownership makes falls more likely
+        ownership_mod = np.select(
+            [
+                rising & (ownership > self.HIGH_OWNERSHIP),
+                rising & (ownership < self.LOW_OWNERSHIP),
+                ~rising & (ownership < self.LOW_OWNERSHIP),
+                ~rising & (ownership > self.HIGH_OWNERSHIP)
+            ],
+            [1.2, 0.8, 1.2, 0.8],
+            default=1.0
+        )
         
         # Form modifier for rises
-        form_mod = pd.Series(1.0, index=df.index)
-        form_mod[net > 0] = 1 + (form[net > 0] / 10 * 0.2)
+        form_mod = np.where(rising, 1 + (form / 10 * 0.2), 1.0)
+        
+        if _NUMEXPR_AVAILABLE:
+            # One fused pass over the three arrays instead of a temporary per operation
+            prob = numexpr.evaluate(
+                "where(base_prob * ownership_mod * form_mod > 100, 100, "
+                "where(base_prob * ownership_mod * form_mod < 0, 0, "
+                "base_prob * ownership_mod * form_mod))"
+            )
+        else:
+            prob = base_prob
+            prob *= ownership_mod
+            prob *= form_mod
+            np.clip(prob, 0, 100, out=prob)
         
-        return (base_prob * ownership_mod * form_mod).clip(0, 100)
+        return pd.Series(prob, index=df.index)
+    
+    @staticmethod
+    def _column_values(df: pd.DataFrame, column: str) -> np.ndarray:
+        """Return a pre-coerced column as an array, or zeros when it is missing."""
+        if column not in df.columns:
+            return np.zeros(len(df))
+        return df[column].to_numpy()
     
     def _identify_risers(
         self,
@@ -159,40 +203,47 @@ class PriceChangePredictor:
         """
         # Filter for rising players
         threshold = self.PROBABLE_RISE_THRESHOLD if include_probable else self.DEFINITE_RISE_THRESHOLD
-        risers_df = df[df['net_transfers'] > threshold].copy()
+        risers_df = df[df['net_transfers'] > threshold]
         
-        # Sort by net transfers (strongest signal)
-        risers_df = risers_df.sort_values('net_transfers', ascending=False)
+        # Top 20 risers by net transfers (strongest signal)
+        top = risers_df.iloc[self._top_positions(risers_df['net_transfers'].to_numpy(), 20)]
+        net = top['net_transfers'].to_numpy().astype(int)
         
-        # Build result list
-        risers = []
-        for _, player in risers_df.head(20).iterrows():  # Top 20 risers
-            net = int(player['net_transfers'])
-            
-            # Determine confidence level
-            if net >= self.DEFINITE_RISE_THRESHOLD:
-                confidence = 'HIGH'
-                emoji = '🔥'
-            else:
-                confidence = 'MEDIUM'
-                emoji = '📈'
-            
-            risers.append({
+        # Determine confidence level
+        definite = net >= self.DEFINITE_RISE_THRESHOLD
+        confidence = np.where(definite, 'HIGH', 'MEDIUM').tolist()
+        emoji = np.where(definite, '🔥', '📈').tolist()
+        display = self._display_strings(emoji, top['web_name'], net, confidence)
+        
+        rows = self._select_records(top, {
+            'web_name': None,
+            'team_name': 'Unknown',
+            'position': 'Unknown',
+            'now_cost': 0,
+            'transfers_in_event': None,
+            'selected_by_percent': 0,
+            'form': 0,
+            'change_probability': None
+        })
+        
+        return [
+            {
                 'name': player['web_name'],
-                'team': player.get('team_name', 'Unknown'),
-                'position': player.get('position', 'Unknown'),
-                'current_price': float(player.get('now_cost', 0)) / 10,
-                'net_transfers': net,
+                'team': player['team_name'],
+                'position': player['position'],
+                'current_price': float(player['now_cost']) / 10,
+                'net_transfers': player_net,
                 'transfers_in': int(player['transfers_in_event']),
-                'ownership': float(player.get('selected_by_percent', 0)),
-                'form': float(player.get('form', 0)),
+                'ownership': round(float(player['selected_by_percent']), 1),
+                'form': round(float(player['form']), 1),
                 'probability': round(float(player['change_probability']), 1),
-                'confidence': confidence,
-                'emoji': emoji,
-                'display': f"{emoji} {player['web_name']} - {net//1000}K net ({confidence})"
-            })
-        
-        return risers
+                'confidence': player_confidence,
+                'emoji': player_emoji,
+                'display': player_display
+            }
+            for player, player_net, player_confidence, player_emoji, player_display
+            in zip(rows, net.tolist(), confidence, emoji, display)
+        ]
     
     def _identify_fallers(
         self,
@@ -211,40 +262,47 @@ class PriceChangePredictor:
         """
         # Filter for falling players
         threshold = self.PROBABLE_FALL_THRESHOLD if include_probable else self.DEFINITE_FALL_THRESHOLD
-        fallers_df = df[df['net_transfers'] < threshold].copy()
+        fallers_df = df[df['net_transfers'] < threshold]
         
-        # Sort by net transfers (most negative first)
-        fallers_df = fallers_df.sort_values('net_transfers', ascending=True)
+        # Top 20 fallers by net transfers (most negative first)
+        top = fallers_df.iloc[self._top_positions(-fallers_df['net_transfers'].to_numpy(), 20)]
+        net = top['net_transfers'].to_numpy().astype(int)
         
-        # Build result list
-        fallers = []
-        for _, player in fallers_df.head(20).iterrows():  # Top 20 fallers
-            net = int(player['net_transfers'])
-            
-            # Determine confidence level
-            if net <= self.DEFINITE_FALL_THRESHOLD:
-                confidence = 'HIGH'
-                emoji = '🔻'
-            else:
-                confidence = 'MEDIUM'
-                emoji = '📉'
-            
-            fallers.append({
+        # Determine confidence level
+        definite = net <= self.DEFINITE_FALL_THRESHOLD
+        confidence = np.where(definite, 'HIGH', 'MEDIUM').tolist()
+        emoji = np.where(definite, '🔻', '📉').tolist()
+        display = self._display_strings(emoji, top['web_name'], net, confidence)
+        
+        rows = self._select_records(top, {
+            'web_name': None,
+            'team_name': 'Unknown',
+            'position': 'Unknown',
+            'now_cost': 0,
+            'transfers_out_event': None,
+            'selected_by_percent': 0,
+            'form': 0,
+            'change_probability': None
+        })
+        
+        return [
+            {
                 'name': player['web_name'],
-                'team': player.get('team_name', 'Unknown'),
-                'position': player.get('position', 'Unknown'),
-                'current_price': float(player.get('now_cost', 0)) / 10,
-                'net_transfers': net,
+                'team': player['team_name'],
+                'position': player['position'],
+                'current_price': float(player['now_cost']) / 10,
+                'net_transfers': player_net,
                 'transfers_out': int(player['transfers_out_event']),
-                'ownership': float(player.get('selected_by_percent', 0)),
-                'form': float(player.get('form', 0)),
+                'ownership': round(float(player['selected_by_percent']), 1),
+                'form': round(float(player['form']), 1),
                 'probability': round(float(player['change_probability']), 1),
-                'confidence': confidence,
-                'emoji': emoji,
-                'display': f"{emoji} {player['web_name']} - {abs(net)//1000}K net ({confidence})"
-            })
-        
-        return fallers
+                'confidence': player_confidence,
+                'emoji': player_emoji,
+                'display': player_display
+            }
+            for player, player_net, player_confidence, player_emoji, player_display
+            in zip(rows, net.tolist(), confidence, emoji, display)
+        ]
     
     def _identify_watchlist(self, df: pd.DataFrame) -> List[Dict]:
         """
@@ -260,30 +318,99 @@ class PriceChangePredictor:
         watchlist_df = df[
             ((df['net_transfers'] > 30000) & (df['net_transfers'] < self.PROBABLE_RISE_THRESHOLD)) |
             ((df['net_transfers'] < -30000) & (df['net_transfers'] > self.PROBABLE_FALL_THRESHOLD))
-        ].copy()
+        ]
         
-        watchlist_df = watchlist_df.sort_values(
-            'net_transfers',
-            ascending=False,
-            key=lambda x: abs(x)
-        )
+        # Rank by precomputed absolute net transfers, selecting the top 10 before sorting
+        abs_net = np.abs(watchlist_df['net_transfers'].to_numpy())
+        top = watchlist_df.iloc[self._top_positions(abs_net, 10)]
+        net = top['net_transfers'].to_numpy().astype(int)
+        direction = np.where(net > 0, 'Rising', 'Falling').tolist()
+        display = self._display_strings(['⚠️'] * len(net), top['web_name'], net, direction)
         
-        watchlist = []
-        for _, player in watchlist_df.head(10).iterrows():
-            net = int(player['net_transfers'])
-            direction = 'Rising' if net > 0 else 'Falling'
-            
-            watchlist.append({
+        rows = self._select_records(top, {
+            'web_name': None,
+            'team_name': 'Unknown',
+            'now_cost': 0,
+            'change_probability': None
+        })
+        
+        return [
+            {
                 'name': player['web_name'],
-                'team': player.get('team_name', 'Unknown'),
-                'current_price': float(player.get('now_cost', 0)) / 10,
-                'net_transfers': net,
-                'direction': direction,
+                'team': player['team_name'],
+                'current_price': float(player['now_cost']) / 10,
+                'net_transfers': player_net,
+                'direction': player_direction,
                 'probability': round(float(player['change_probability']), 1),
-                'display': f"⚠️ {player['web_name']} - {abs(net)//1000}K net ({direction})"
-            })
+                'display': player_display
+            }
+            for player, player_net, player_direction, player_display
+            in zip(rows, net.tolist(), direction, display)
+        ]
+    
+    @staticmethod
+    def _top_positions(values: np.ndarray, n: int) -> np.ndarray:
+        """
+        Positions of the n largest values, largest first.
+        
+        Uses argpartition so only the selected n values get sorted.
+        
+        Args:
+            values: Values to rank
+            n: Number of positions to return
+            
+        Returns:
+            Array of integer positions into values
+        """
+        if len(values) > n:
+            top = np.argpartition(-values, n)[:n]
+        else:
+            top = np.arange(len(values))
+        return top[np.argsort(-values[top], kind='stable')]
+    
+    @classmethod
+    def _display_strings(
+        cls,
+        emoji: List[str],
+        names: pd.Series,
+        net: np.ndarray,
+        labels: List[str]
+    ) -> List[str]:
+        """
+        Build the display line for each player in one pass.
         
-        return watchlist
+        Maps the bound DISPLAY_FORMAT.format over the columns, with the
+        thousands of net transfers computed as one array operation.
+        
+        Args:
+            emoji: Emoji per player
+            names: Player names
+            net: Net transfers per player
+            labels: Confidence or direction label per player
+            
+        Returns:
+            List of display strings
+        """
+        thousands = (np.abs(net) // 1000).tolist()
+        return list(map(cls.DISPLAY_FORMAT.format, emoji, names.tolist(), thousands, labels))
+    
+    @staticmethod
+    def _select_records(df: pd.DataFrame, columns: Dict[str, object]) -> List[Dict]:
+        """
+        Convert selected columns to a list of row dicts in one pass.
+        
+        Args:
+            df: Player DataFrame slice
+            columns: Column name to default value used when the column is
+                missing; None marks a required column
+                
+        Returns:
+            List of dicts keyed by column name
+        """
+        return pd.DataFrame(
+            {col: df[col] if default is None else df.get(col, default) for col, default in columns.items()},
+            index=df.index
+        ).to_dict('records')
     
     def _calculate_stats(
         self,
@@ -312,7 +439,7 @@ class PriceChangePredictor:
             'total_transfers_in': int(total_transfers_in),
             'total_transfers_out': int(total_transfers_out),
             'net_transfers': int(total_transfers_in - total_transfers_out),
-            'avg_ownership': round(df.get('selected_by_percent', pd.Series([0])).mean(), 2)
+            'avg_ownership': round(float(df.get('selected_by_percent', pd.Series([0])).mean()), 2)
         }
     
     def _get_empty_result(self) -> Dict:
@@ -5,12 +5,98 @@ Based on FPL's price change algorithm using net transfers
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+import hashlib
+from typing import Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _as_32bit(values: pd.Series) -> np.ndarray:
+    """Raw column values as int32 for plain integer columns, float32 (NaN for missing) otherwise"""
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in 'iu':
+        return values.to_numpy(dtype=np.int32)
+    return values.to_numpy(dtype=np.float32, na_value=np.nan)
+
+
+def _compute_predictions(
+    transfers_in: np.ndarray,
+    transfers_out: np.ndarray,
+    transfers_in_event: Optional[np.ndarray],
+    transfers_out_event: Optional[np.ndarray],
+    selected_by_percent: Optional[np.ndarray],
+    rise_base: float,
+    fall_base: float
+) -> Dict[str, np.ndarray]:
+    """
+    Compute every price prediction column from the raw input arrays in one pass
+    
+    Args:
+        transfers_in: Season transfers in
+        transfers_out: Season transfers out
+        transfers_in_event: Gameweek transfers in, or None when unavailable
+        transfers_out_event: Gameweek transfers out, or None when unavailable
+        selected_by_percent: Ownership percentage, or None when unavailable
+        rise_base: Net transfers needed for a rise at zero ownership
+        fall_base: Net transfers needed for a fall at zero ownership
+        
+    Returns:
+        Dict of output column name to array, with prediction_confidence as
+        int8 codes (0=Low, 1=Medium, 2=High)
+    """
+    n = len(transfers_in)
+    
+    # Calculate net transfers, overall and this gameweek
+    net_transfers = transfers_in - transfers_out
+    if transfers_in_event is not None:
+        net_event = transfers_in_event - transfers_out_event
+    else:
+        net_event = np.zeros(n, dtype=np.int32)
+    
+    # Ownership factor (higher ownership = easier price change) and adjusted thresholds
+    if selected_by_percent is not None:
+        ownership_factor = selected_by_percent / 10
+    else:
+        ownership_factor = np.ones(n, dtype=np.float32)
+    scale = 1 + ownership_factor * 0.1
+    rise_threshold = rise_base / scale
+    fall_threshold = fall_base / scale
+    
+    # Direction masks, shared by the probability and the predicted change
+    rising = net_event > 0
+    falling = net_event < 0
+    
+    # Price change probability (0-100) for rising and falling players; for fallers
+    # both net transfers and the threshold are negative, so the signs cancel
+    prob = np.where(
+        rising,
+        net_event / rise_threshold,
+        np.where(falling, net_event / fall_threshold, 0.0)
+    ) * 100
+    np.clip(prob, 0, 100, out=prob)
+    
+    # Probability bands, compared once and reused below
+    high = prob > 80
+    mid = prob > 50
+    
+    # Predict price change direction: likely/possible rise, likely fall
+    predicted = np.select([rising & mid, falling & high], [1, -1], default=0)
+    
+    # Prediction confidence codes (high implies mid, so the sum is 0, 1 or 2)
+    confidence = mid.astype(np.int8) + high
+    
+    return {
+        'net_transfers': net_transfers,
+        'net_transfers_event': net_event,
+        'ownership_factor': ownership_factor,
+        'rise_threshold': rise_threshold,
+        'fall_threshold': fall_threshold,
+        'price_change_probability': prob,
+        'predicted_price_change': predicted,
+        'prediction_confidence': confidence
+    }
+
+
 class PriceChangePredictorService:
     """
     Predicts player price changes based on transfer activity
@@ -25,9 +111,31 @@ class PriceChangePredictorService:
     BASE_RISE_THRESHOLD = 100000  # Net transfers needed for price rise
     BASE_FALL_THRESHOLD = -100000  # Net transfers needed for price fall
     
+    # Prediction confidence levels, lowest first
+    CONFIDENCE_LEVELS = ['Low', 'Medium', 'High']
+    
+    # Transfer momentum categories, indexed by code
+    MOMENTUM_CATEGORIES = ['Stable', 'Rising', 'Hot', 'Falling']
+    
+    # Input columns the predictions are computed from
+    INPUT_COLUMNS = [
+        'transfers_in', 'transfers_out', 'transfers_in_event',
+        'transfers_out_event', 'selected_by_percent'
+    ]
+    
     def __init__(self):
         """Initialize the price change predictor"""
         self.predictions = []
+        # Last prediction as (input fingerprint, output columns)
+        self._last_prediction = None
+    
+    def _frame_key(self, df: pd.DataFrame) -> bytes:
+        """Content hash of the input columns, so in-place edits invalidate the memoized prediction"""
+        columns = [col for col in self.INPUT_COLUMNS if col in df.columns]
+        row_hashes = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+        digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+        digest.update(repr(columns).encode())
+        return digest.digest()
     
     def predict_price_changes(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -43,60 +151,42 @@ class PriceChangePredictorService:
             logger.warning("Empty dataframe provided to predict_price_changes")
             return df
         
-        df = df.copy()
-        
-        # Calculate net transfers
-        if 'transfers_in' in df.columns and 'transfers_out' in df.columns:
-            df['net_transfers'] = df['transfers_in'] - df['transfers_out']
-        else:
+        if 'transfers_in' not in df.columns or 'transfers_out' not in df.columns:
             logger.warning("Missing transfer data for price predictions")
             return df
         
-        # Calculate net transfers this gameweek
-        if 'transfers_in_event' in df.columns and 'transfers_out_event' in df.columns:
-            df['net_transfers_event'] = df['transfers_in_event'] - df['transfers_out_event']
-        else:
-            df['net_transfers_event'] = 0
-        
-        # Calculate ownership factor (higher ownership = easier price change)
-        if 'selected_by_percent' in df.columns:
-            df['ownership_factor'] = df['selected_by_percent'] / 10  # Scale factor
-        else:
-            df['ownership_factor'] = 1.0
-        
-        # Adjusted thresholds based on ownership
-        df['rise_threshold'] = self.BASE_RISE_THRESHOLD / (1 + df['ownership_factor'] * 0.1)
-        df['fall_threshold'] = self.BASE_FALL_THRESHOLD / (1 + df['ownership_factor'] * 0.1)
-        
-        # Calculate price change probability (0-100)
-        df['price_change_probability'] = 0
-        
-        # Rising players
-        rise_mask = df['net_transfers_event'] > 0
-        df.loc[rise_mask, 'price_change_probability'] = (
-            (df.loc[rise_mask, 'net_transfers_event'] / df.loc[rise_mask, 'rise_threshold']) * 100
-        ).clip(0, 100)
-        
-        # Falling players
-        fall_mask = df['net_transfers_event'] < 0
-        df.loc[fall_mask, 'price_change_probability'] = (
-            (abs(df.loc[fall_mask, 'net_transfers_event']) / abs(df.loc[fall_mask, 'fall_threshold'])) * 100
-        ).clip(0, 100)
-        
-        # Predict price change direction
-        df['predicted_price_change'] = 0
-        df.loc[df['price_change_probability'] > 80, 'predicted_price_change'] = 1  # Likely rise
-        df.loc[(df['price_change_probability'] > 50) & (df['predicted_price_change'] == 0), 'predicted_price_change'] = 1  # Possible rise
-        df.loc[(df['net_transfers_event'] < 0) & (df['price_change_probability'] > 80), 'predicted_price_change'] = -1  # Likely fall
-        
-        # Add prediction confidence
-        df['prediction_confidence'] = 'Low'
-        df.loc[df['price_change_probability'] > 50, 'prediction_confidence'] = 'Medium'
-        df.loc[df['price_change_probability'] > 80, 'prediction_confidence'] = 'High'
-        
-        logger.info(f"Predicted price changes for {len(df)} players")
-        
-        return df
+        # Reuse the last prediction when the input columns are unchanged; it is
+        # re-assigned onto this frame, so other columns are current and every
+        # caller gets its own frame
+        key = self._frame_key(df)
+        last = self._last_prediction
+        if last is not None and last[0] == key:
+            return df.assign(**{col: values.copy() for col, values in last[1].items()})
+        
+        # 32-bit inputs halve the bytes the kernel streams through
+        has_event = 'transfers_in_event' in df.columns and 'transfers_out_event' in df.columns
+        out = _compute_predictions(
+            _as_32bit(df['transfers_in']),
+            _as_32bit(df['transfers_out']),
+            _as_32bit(df['transfers_in_event']) if has_event else None,
+            _as_32bit(df['transfers_out_event']) if has_event else None,
+            _as_32bit(df['selected_by_percent']) if 'selected_by_percent' in df.columns else None,
+            self.BASE_RISE_THRESHOLD,
+            self.BASE_FALL_THRESHOLD
+        )
+        out['prediction_confidence'] = pd.Categorical.from_codes(
+            out['prediction_confidence'], categories=self.CONFIDENCE_LEVELS, ordered=True
+        )
+        
+        # One assign writes every output column to a new frame; the caller's df is never mutated
+        result = df.assign(**out)
+        
+        logger.info(f"Predicted price changes for {len(result)} players")
+        
+        # Private copies: without copy-on-write the result may share these arrays
+        self._last_prediction = (key, {col: values.copy() for col, values in out.items()})
+        
+        return result
     
     def get_rising_players(self, df: pd.DataFrame, min_probability: float = 50) -> pd.DataFrame:
         """
@@ -112,12 +202,14 @@ class PriceChangePredictorService:
         if 'price_change_probability' not in df.columns:
             df = self.predict_price_changes(df)
         
-        rising = df[
-            (df['net_transfers_event'] > 0) &
-            (df['price_change_probability'] >= min_probability)
-        ].copy()
+        # Gather only the matching positions rather than indexing with a full-length mask
+        rising = df.iloc[np.flatnonzero(
+            (df['net_transfers_event'].to_numpy() > 0) &
+            (df['price_change_probability'].to_numpy() >= min_probability)
+        )]
         
-        return rising.sort_values('price_change_probability', ascending=False)
+        # Stable sort, so ties keep frame order whatever the threshold
+        return rising.sort_values('price_change_probability', ascending=False, kind='stable')
     
     def get_falling_players(self, df: pd.DataFrame, min_probability: float = 50) -> pd.DataFrame:
         """
@@ -133,12 +225,14 @@ class PriceChangePredictorService:
         if 'price_change_probability' not in df.columns:
             df = self.predict_price_changes(df)
         
-        falling = df[
-            (df['net_transfers_event'] < 0) &
-            (df['price_change_probability'] >= min_probability)
-        ].copy()
+        # Gather only the matching positions rather than indexing with a full-length mask
+        falling = df.iloc[np.flatnonzero(
+            (df['net_transfers_event'].to_numpy() < 0) &
+            (df['price_change_probability'].to_numpy() >= min_probability)
+        )]
         
-        return falling.sort_values('price_change_probability', ascending=False)
+        # Stable sort, so ties keep frame order whatever the threshold
+        return falling.sort_values('price_change_probability', ascending=False, kind='stable')
     
     def get_price_change_alerts(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """
@@ -150,13 +244,17 @@ class PriceChangePredictorService:
         Returns:
             Dictionary with 'urgent_rises', 'urgent_falls', 'watch_rises', 'watch_falls'
         """
+        # Predict once, then filter and sort each direction once at the watch threshold
         df = self.predict_price_changes(df)
+        rising = self.get_rising_players(df, min_probability=50)
+        falling = self.get_falling_players(df, min_probability=50)
         
+        # Urgent alerts are the sorted lists' prefixes above 80%
         return {
-            'urgent_rises': self.get_rising_players(df, min_probability=80),
-            'urgent_falls': self.get_falling_players(df, min_probability=80),
-            'watch_rises': self.get_rising_players(df, min_probability=50).head(20),
-            'watch_falls': self.get_falling_players(df, min_probability=50).head(20)
+            'urgent_rises': rising[rising['price_change_probability'] >= 80],
+            'urgent_falls': falling[falling['price_change_probability'] >= 80],
+            'watch_rises': rising.head(20),
+            'watch_falls': falling.head(20)
         }
     
     def calculate_transfer_momentum(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -169,27 +267,33 @@ class PriceChangePredictorService:
         Returns:
             DataFrame with momentum metrics
         """
-        df = df.copy()
+        # Momentum array resolved once: computed here, carried on the input, or zeros
+        momentum = np.zeros(len(df), dtype=np.float32)
+        columns = {}
         
         # Calculate momentum as percentage of total transfers
         if 'transfers_in' in df.columns:
             total_transfers = df['transfers_in'].sum()
             if total_transfers > 0:
-                df['transfer_momentum'] = (df['transfers_in'] / total_transfers) * 100
+                momentum = (df['transfers_in'].to_numpy() / total_transfers) * 100
+                columns['transfer_momentum'] = momentum
             else:
-                df['transfer_momentum'] = 0
-        
-        # Add momentum category
-        df['momentum_category'] = 'Stable'
-        df.loc[df.get('transfer_momentum', 0) > 2, 'momentum_category'] = 'Rising'
-        df.loc[df.get('transfer_momentum', 0) > 5, 'momentum_category'] = 'Hot'
+                columns['transfer_momentum'] = 0
+        elif 'transfer_momentum' in df.columns:
+            momentum = df['transfer_momentum'].to_numpy()
         
         # For players being transferred out
         if 'transfers_out' in df.columns:
-            high_out = df['transfers_out'] > df['transfers_out'].quantile(0.75)
-            df.loc[high_out, 'momentum_category'] = 'Falling'
-        
-        return df
+            high_out = (df['transfers_out'] > df['transfers_out'].quantile(0.75)).to_numpy()
+        else:
+            high_out = np.zeros(len(df), dtype=bool)
+        
+        # Add momentum category in one pass; heavy transfers out override rising momentum
+        codes = np.select([high_out, momentum > 5, momentum > 2], [3, 2, 1], default=0).astype(np.int8)
+        return df.assign(
+            **columns,
+            momentum_category=pd.Categorical.from_codes(codes, categories=self.MOMENTUM_CATEGORIES)
+        )
     
     def get_price_targets(self, df: pd.DataFrame, budget: float = 100.0) -> pd.DataFrame:
         """
@@ -204,16 +308,17 @@ class PriceChangePredictorService:
         """
         df = self.predict_price_changes(df)
         
-        # Filter for rising players within budget
-        targets = df[
-            (df['predicted_price_change'] == 1) &
-            (df['price_change_probability'] > 60) &
-            (df['now_cost'] / 10 <= budget)
-        ].copy()
+        # Filter for rising players within budget in one mask over the raw arrays
+        mask = (
+            (df['predicted_price_change'].to_numpy() == 1) &
+            (df['price_change_probability'].to_numpy() > 60) &
+            (df['now_cost'].to_numpy() / 10 <= budget)
+        )
+        targets = df.iloc[np.flatnonzero(mask)]
         
         # Add value metrics
         if 'form' in targets.columns:
-            targets['value_potential'] = targets['form'] * targets['price_change_probability'] / 100
+            targets = targets.assign(value_potential=targets['form'] * targets['price_change_probability'] / 100)
         
         return targets.sort_values('price_change_probability', ascending=False)
     
@@ -227,19 +332,18 @@ class PriceChangePredictorService:
         Returns:
             DataFrame with estimated_next_price column
         """
-        df = df.copy()
-        
         if 'now_cost' not in df.columns:
             logger.warning("Missing now_cost for price estimation")
             return df
         
+        # Predict on the caller's frame so a memoized prediction can be reused
         if 'predicted_price_change' not in df.columns:
             df = self.predict_price_changes(df)
         
-        # FPL prices change in £0.1m increments
-        df['estimated_next_price'] = df['now_cost'] + (df['predicted_price_change'] * 1)
-        
-        # Add price change amount in £
-        df['estimated_change_amount'] = df['predicted_price_change'] * 0.1
-        
-        return df
+        change = df['predicted_price_change'].to_numpy()
+        return df.assign(
+            # FPL prices change in £0.1m increments
+            estimated_next_price=df['now_cost'].to_numpy() + change,
+            # Add price change amount in £
+            estimated_change_amount=change * 0.1
+        )
@@ -3,11 +3,99 @@ UI Component Service
 Handles rendering of common UI components and layouts
 """
 
+import numpy as np
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+from typing import Optional, Tuple
+
+
+def _top_k_positions(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the k largest values, largest first, in O(N)
+    
+    Earlier positions win ties, matching sorted(..., reverse=True)[:k].
+    """
+    n = len(values)
+    if n <= k:
+        return np.argsort(-values, kind='stable')
+    kth = np.partition(values, n - k)[n - k]
+    above = np.flatnonzero(values > kth)
+    tied = np.flatnonzero(values == kth)[:k - len(above)]
+    top = np.concatenate([above, tied])
+    return top[np.argsort(-values[top], kind='stable')]
+
+
+@st.cache_data(ttl=60)
+def _build_top_performers(top_players: Optional[Tuple[Tuple, ...]]) -> Tuple[pd.DataFrame, go.Figure]:
+    """
+    Build the top performers frame and bar chart
+    
+    Cached on the (name, points, ownership, cost) rows, so reruns with
+    unchanged leaders skip the Plotly figure construction.
+    """
+    if top_players is not None:
+        # One transpose of the rows into columns instead of a walk per column
+        names, points, ownership, cost = zip(*top_players) if top_players else ((), (), (), ())
+        ownership = np.array(ownership, dtype=np.float64)
+        price = np.array(cost, dtype=np.float64) / 10  # API returns price in tenths
+    else:
+        # Fallback data
+        names = ('Haaland', 'Palmer', 'Salah', 'Saka', 'Son')
+        points = (156, 142, 138, 125, 118)
+        ownership = np.array([45.2, 28.4, 35.8, 22.1, 16.7])
+        price = np.array([15.1, 6.6, 12.7, 8.2, 9.5])
+    
+    # Interactive bar chart straight from the arrays, no intermediate DataFrame
+    fig = go.Figure(go.Bar(
+        x=list(points),
+        y=list(names),
+        orientation='h',
+        marker=dict(color=list(points), colorscale='Viridis', colorbar=dict(title='Total Points'))
+    ))
+    fig.update_layout(
+        title='Top Performers by Total Points',
+        xaxis_title='Total Points',
+        yaxis_title='Player',
+        height=300
+    )
+    
+    # The frame is only built for the caller
+    top_performers = pd.DataFrame({
+        'Player': list(names),
+        'Total Points': list(points),
+        'Ownership %': ownership,
+        'Price': price
+    })
+    return top_performers, fig
+
+
+@st.cache_data(ttl=60)
+def _build_performance_gauge(score, reference) -> go.Figure:
+    """Build the performance gauge figure, cached on (score, reference)"""
+    gauge_fig = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = score,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Performance Score"},
+        delta = {'reference': reference},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 50], 'color': "lightgray"},
+                {'range': [50, 80], 'color': "gray"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+    gauge_fig.update_layout(height=250)
+    return gauge_fig
 
 
 class UIComponentService:
@@ -15,7 +103,9 @@ class UIComponentService:
     
     def __init__(self):
         """Initialize the UI component service"""
-        pass
+        # Top performer rows and the elements list they were picked from
+        self._top_players: Optional[Tuple[Tuple, ...]] = None
+        self._top_source: Optional[list] = None
     
     def render_enhanced_header(self):
         """Render enhanced header with status indicators"""
@@ -30,29 +120,22 @@ class UIComponentService:
         </div>
         """, unsafe_allow_html=True)
         
-        # Status indicators
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
+        # Status indicators, emitted as one flex row instead of five column widgets
         api_online = st.session_state.get('api_status', 'offline') == 'online'
-        
-        with col1:
-            if api_online:
-                st.markdown('<span class="status-indicator status-online">🟢 FPL API: Live</span>', unsafe_allow_html=True)
-            else:
-                st.markdown('<span class="status-indicator status-offline">🔴 FPL API: Offline</span>', unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown('<span class="status-indicator status-online">🟢 Analytics: Active</span>', unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown('<span class="status-indicator status-online">🟢 AI Engine: Ready</span>', unsafe_allow_html=True)
-        
-        with col4:
-            data_source = "Live Data" if api_online else "Cached Data"
-            st.markdown(f'<span class="status-indicator status-online">📊 Source: {data_source}</span>', unsafe_allow_html=True)
-        
-        with col5:
-            st.markdown(f'<span class="status-indicator status-online">🕐 Updated: {datetime.now().strftime("%H:%M")}</span>', unsafe_allow_html=True)
+        data_source = "Live Data" if api_online else "Cached Data"
+        indicators = [
+            ('status-online', '🟢 FPL API: Live') if api_online else ('status-offline', '🔴 FPL API: Offline'),
+            ('status-online', '🟢 Analytics: Active'),
+            ('status-online', '🟢 AI Engine: Ready'),
+            ('status-online', f'📊 Source: {data_source}'),
+            ('status-online', f'🕐 Updated: {datetime.now().strftime("%H:%M")}')
+        ]
+        st.markdown(
+            '<div style="display: flex; justify-content: space-around; flex-wrap: wrap;">'
+            + ''.join(f'<span class="status-indicator {css}">{text}</span>' for css, text in indicators)
+            + '</div>',
+            unsafe_allow_html=True
+        )
     
     def render_key_metrics(self, data):
         """Render key performance metrics"""
@@ -108,65 +191,32 @@ class UIComponentService:
         """Render top performers chart"""
         # Create top performers data from live API
         if isinstance(data, dict) and 'elements' in data:
-            # Live API data - get top performers by total points
+            # Live API data - top 5 by total points, selected without a full sort
             players_data = data.get('elements', [])
-            # Sort by total points and get top 5
-            top_players = sorted(players_data, key=lambda x: x.get('total_points', 0), reverse=True)[:5]
-            
-            top_performers = pd.DataFrame({
-                'Player': [p.get('web_name', 'Unknown') for p in top_players],
-                'Total Points': [p.get('total_points', 0) for p in top_players],
-                'Ownership %': [float(p.get('selected_by_percent', '0')) for p in top_players],
-                'Price': [p.get('now_cost', 0) / 10 for p in top_players]  # API returns price in tenths
-            })
+            # Reruns over the same elements list reuse the rows picked last time
+            if players_data is not self._top_source:
+                points = np.fromiter(
+                    (p.get('total_points', 0) for p in players_data), dtype=np.float64, count=len(players_data)
+                )
+                self._top_players = tuple(
+                    (p.get('web_name', 'Unknown'), p.get('total_points', 0),
+                     p.get('selected_by_percent', '0'), p.get('now_cost', 0))
+                    for p in (players_data[i] for i in _top_k_positions(points, 5))
+                )
+                self._top_source = players_data
+            top_players = self._top_players
         else:
-            # Fallback data
-            top_performers = pd.DataFrame({
-                'Player': ['Haaland', 'Palmer', 'Salah', 'Saka', 'Son'],
-                'Total Points': [156, 142, 138, 125, 118],
-                'Ownership %': [45.2, 28.4, 35.8, 22.1, 16.7],
-                'Price': [15.1, 6.6, 12.7, 8.2, 9.5]
-            })
+            top_players = None
         
         # Interactive bar chart
-        fig = px.bar(
-            top_performers, 
-            x='Total Points', 
-            y='Player',
-            orientation='h',
-            color='Total Points',
-            color_continuous_scale='viridis',
-            title='Top Performers by Total Points'
-        )
-        fig.update_layout(height=300)
+        top_performers, fig = _build_top_performers(top_players)
         st.plotly_chart(fig, width='stretch')
         
         return top_performers
     
     def render_performance_gauge(self, score=78, reference=72):
         """Render performance gauge"""
-        gauge_fig = go.Figure(go.Indicator(
-            mode = "gauge+number+delta",
-            value = score,
-            domain = {'x': [0, 1], 'y': [0, 1]},
-            title = {'text': "Performance Score"},
-            delta = {'reference': reference},
-            gauge = {
-                'axis': {'range': [None, 100]},
-                'bar': {'color': "darkblue"},
-                'steps': [
-                    {'range': [0, 50], 'color': "lightgray"},
-                    {'range': [50, 80], 'color': "gray"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 90
-                }
-            }
-        ))
-        gauge_fig.update_layout(height=250)
-        st.plotly_chart(gauge_fig, width='stretch')
+        st.plotly_chart(_build_performance_gauge(score, reference), width='stretch')
     
     def render_live_data_indicator(self, data):
         """Format and display live data connection indicator"""
@@ -180,22 +230,26 @@ class UIComponentService:
         """Render application footer"""
         st.markdown("---")
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.caption("🚀 **FPL Analytics Resilient**")
-        with col2:
-            st.caption("⚡ **Intelligent Fallback Systems**")
-        with col3:
-            st.caption("🤖 **AI-Powered Analysis**")
-        with col4:
-            st.caption(f"📊 **Updated**: {datetime.now().strftime('%H:%M:%S')}")
+        # Footer items in a single caption-styled flex row
+        items = [
+            "🚀 <strong>FPL Analytics Resilient</strong>",
+            "⚡ <strong>Intelligent Fallback Systems</strong>",
+            "🤖 <strong>AI-Powered Analysis</strong>",
+            f"📊 <strong>Updated</strong>: {datetime.now().strftime('%H:%M:%S')}"
+        ]
+        st.markdown(
+            '<div style="display: flex; justify-content: space-around; flex-wrap: wrap; font-size: 0.875rem; opacity: 0.6;">'
+            + ''.join(f'<span>{item}</span>' for item in items)
+            + '</div>',
+            unsafe_allow_html=True
+        )
     
     def _get_current_gameweek(self, data):
         """Extract current gameweek from FPL data"""
         if isinstance(data, dict) and 'events' in data:
-            events = data.get('events', [])
-            for event in events:
-                if event.get('is_current', False):
-                    return event.get('id', 1)
+            # First current event, stopping at the hit; fall back to GW 10
+            return next(
+                (event.get('id', 1) for event in data.get('events', []) if event.get('is_current', False)),
+                10
+            )
         return 10  # Fallback to GW 10
\ No newline at end of file
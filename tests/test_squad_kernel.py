@@ -0,0 +1,35 @@
+"""
+Tests for the squad selection kernels
+"""
+
+import numpy as np
+import pytest
+
+from utils._squad_kernel import _greedy_select_loop, greedy_select
+
+POS_LIMITS = np.array([2, 5, 5, 3], dtype=np.int64)
+
+
+@pytest.mark.parametrize("select", [greedy_select, _greedy_select_loop], ids=["kernel", "python"])
+def test_greedy_returns_partial_squad_when_no_full_squad_is_affordable(select):
+    # 15 players at 15.0m each: the cheapest full squad costs 225.0m
+    position = np.repeat(np.arange(4, dtype=np.int64), POS_LIMITS)
+    cost = np.full(15, 150.0)
+    team = np.arange(15, dtype=np.int64)
+    
+    selected = select(position, cost, team, POS_LIMITS, 3, 15, 1000.0, 15)
+    
+    # Players are taken in order while they fit the 100.0m budget
+    assert selected.tolist() == [0, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("select", [greedy_select, _greedy_select_loop], ids=["kernel", "python"])
+def test_greedy_reserves_budget_for_open_slots(select):
+    # An expensive first pick would leave too little for the other 14 slots
+    position = np.concatenate([[2], np.repeat(np.arange(4, dtype=np.int64), POS_LIMITS)])
+    cost = np.concatenate([[500.0], np.full(15, 40.0)])
+    team = np.arange(16, dtype=np.int64)
+    
+    selected = select(position, cost, team, POS_LIMITS, 3, 16, 1000.0, 15)
+    
+    assert selected.tolist() == list(range(1, 16))
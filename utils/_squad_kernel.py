@@ -0,0 +1,293 @@
+"""
+Squad Selection Kernel
+Exact and greedy budget/position/team-capped squad picks for BestTeamGenerator
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+def _greedy_select_loop(position, cost, team, pos_limits, team_limit, num_teams,
+                        budget, squad_size) -> np.ndarray:
+    """
+    Walk players in priority order, taking each one that still fits
+    
+    Args:
+        position: Position code per player (-1 for positions not in the squad)
+        cost: Player cost in 0.1m units
+        team: Team code per player (-1 for unknown, never capped)
+        pos_limits: Players needed per position code
+        team_limit: Maximum players from one team
+        num_teams: Number of distinct team codes
+        budget: Budget in 0.1m units
+        squad_size: Stop once this many players are selected
+    
+    Returns:
+        Array of selected player indices, in selection order
+    """
+    needed = pos_limits.copy()
+    team_counts = np.zeros(num_teams + 1, dtype=np.int64)
+    selected = np.empty(squad_size, dtype=np.int64)
+    count = 0
+    remaining = budget
+    
+    # Cheapest player per position; positions with no players reserve nothing
+    min_cost = np.full(needed.shape[0], np.inf)
+    for i in range(position.shape[0]):
+        pos = position[i]
+        if pos >= 0 and cost[i] < min_cost[pos]:
+            min_cost[pos] = cost[i]
+    reserve = 0.0
+    for pos in range(needed.shape[0]):
+        if min_cost[pos] == np.inf:
+            min_cost[pos] = 0.0
+        reserve += needed[pos] * min_cost[pos]
+    
+    # No complete squad is affordable: drop the reservation so the pick
+    # still returns a partial squad, checking each player against the budget
+    if reserve > budget:
+        min_cost[:] = 0.0
+        reserve = 0.0
+    
+    for i in range(position.shape[0]):
+        # Check if position is still needed
+        pos = position[i]
+        if pos < 0 or needed[pos] <= 0:
+            continue
+        
+        # Check budget, keeping enough back to fill the other open slots at
+        # their cheapest; a pick that breaks this can never complete the squad
+        player_cost = cost[i]
+        if player_cost + reserve - min_cost[pos] > remaining:
+            continue
+        
+        # Check team limit
+        player_team = team[i]
+        if player_team >= 0 and team_counts[player_team] >= team_limit:
+            continue
+        
+        selected[count] = i
+        count += 1
+        remaining -= player_cost
+        reserve -= min_cost[pos]
+        needed[pos] -= 1
+        if player_team >= 0:
+            team_counts[player_team] += 1
+        
+        # Check if squad is complete
+        if count == squad_size:
+            break
+    
+    return selected[:count]
+
+
+def _position_table_loop(cost, score, slots, budget):
+    """
+    0-1 knapsack over one position's players with an exact-count dimension
+    
+    Args:
+        cost: Player cost in 0.1m units (non-negative integers)
+        score: Selection score per player
+        slots: Players to pick for this position
+        budget: Budget in 0.1m units
+    
+    Returns:
+        (best, take): best[k, b] is the highest score from exactly k players
+        costing exactly b (-inf if unreachable); take[i, k, b] marks that
+        player i improved best[k, b] when it was added
+    """
+    n = cost.shape[0]
+    best = np.full((slots + 1, budget + 1), -np.inf)
+    best[0, 0] = 0.0
+    take = np.zeros((n, slots + 1, budget + 1), dtype=np.bool_)
+    
+    for i in range(n):
+        c = cost[i]
+        s = score[i]
+        # Descending k so each player is counted at most once
+        for k in range(min(i + 1, slots), 0, -1):
+            for b in range(c, budget + 1):
+                candidate = best[k - 1, b - c] + s
+                if candidate > best[k, b]:
+                    best[k, b] = candidate
+                    take[i, k, b] = True
+    
+    return best, take
+
+
+def _position_table_numpy(cost, score, slots, budget):
+    """Vectorized equivalent of _position_table_loop, used when numba is unavailable"""
+    n = cost.shape[0]
+    best = np.full((slots + 1, budget + 1), -np.inf)
+    best[0, 0] = 0.0
+    take = np.zeros((n, slots + 1, budget + 1), dtype=np.bool_)
+    
+    for i in range(n):
+        c = int(cost[i])
+        if c > budget:
+            continue
+        for k in range(min(i + 1, slots), 0, -1):
+            candidate = best[k - 1, :budget + 1 - c] + score[i]
+            improved = candidate > best[k, c:]
+            best[k, c:][improved] = candidate[improved]
+            take[i, k, c:] = improved
+    
+    return best, take
+
+
+def _combine(left: np.ndarray, right: np.ndarray):
+    """
+    Max-plus convolution of two exact-cost score rows
+    
+    Returns:
+        (combined, split): combined[b] is the best left + right total costing
+        exactly b, split[b] the part of b spent on the left row
+    """
+    size = left.shape[0]
+    combined = np.full(size, -np.inf)
+    split = np.zeros(size, dtype=np.int64)
+    
+    for b_left in np.flatnonzero(np.isfinite(left)):
+        candidate = left[b_left] + right[:size - b_left]
+        improved = candidate > combined[b_left:]
+        combined[b_left:][improved] = candidate[improved]
+        split[b_left:][improved] = b_left
+    
+    return combined, split
+
+
+def _enforce_team_limit(selected, position, cost, score, team, team_limit, num_teams,
+                        budget) -> np.ndarray:
+    """
+    Swap players out of over-limit teams, giving up as little score as possible
+    
+    Each swap replaces a player from an over-limit team with the best unselected
+    player of the same position that fits the budget and comes from a team with
+    room, so no swap can push another team over the limit.
+    
+    Returns:
+        Sorted selected indices, or an empty array if no valid swap remains
+    """
+    chosen = np.zeros(position.shape[0], dtype=np.bool_)
+    chosen[selected] = True
+    # Last slot collects unknown teams (-1), which are never capped
+    team_slot = np.where(team >= 0, team, num_teams)
+    counts = np.bincount(team_slot[selected], minlength=num_teams + 1)
+    counts[num_teams] = 0
+    remaining = budget - cost[selected].sum()
+    
+    while (counts > team_limit).any():
+        best_loss = np.inf
+        best_swap = None
+        has_room = counts[team_slot] < team_limit
+        for out in np.flatnonzero(chosen & (counts[team_slot] > team_limit)):
+            eligible = (~chosen) & has_room & (position == position[out]) & (cost <= remaining + cost[out])
+            if not eligible.any():
+                continue
+            incoming = int(np.where(eligible, score, -np.inf).argmax())
+            loss = score[out] - score[incoming]
+            if loss < best_loss:
+                best_loss = loss
+                best_swap = (out, incoming)
+        
+        if best_swap is None:
+            return np.empty(0, dtype=np.int64)
+        
+        out, incoming = best_swap
+        chosen[out] = False
+        chosen[incoming] = True
+        counts[team_slot[out]] -= 1
+        counts[team_slot[incoming]] += 1
+        counts[num_teams] = 0
+        remaining += cost[out] - cost[incoming]
+    
+    return np.flatnonzero(chosen)
+
+
+def optimal_select(position, cost, score, team, pos_limits, team_limit, num_teams,
+                   budget) -> np.ndarray:
+    """
+    Highest-scoring squad under budget and position quotas
+    
+    Solves a 0-1 knapsack per position for every exact spend, merges the
+    positions with a max-plus convolution over budget, then repairs any team
+    limit breach with the cheapest swaps.
+    
+    Args:
+        position: Position code per player (-1 for positions not in the squad)
+        cost: Player cost in 0.1m units
+        score: Selection score per player
+        team: Team code per player (-1 for unknown, never capped)
+        pos_limits: Players needed per position code
+        team_limit: Maximum players from one team
+        num_teams: Number of distinct team codes
+        budget: Budget in 0.1m units
+    
+    Returns:
+        Sorted selected player indices, or an empty array when the exact
+        solve does not apply (fractional costs, unfillable quotas or budget)
+    """
+    budget = int(budget)
+    if (cost < 0).any() or (cost != np.rint(cost)).any():
+        return np.empty(0, dtype=np.int64)
+    int_cost = cost.astype(np.int64)
+    score = np.asarray(score, dtype=np.float64)
+    
+    members = []
+    combined = None
+    splits = []
+    for pos in range(pos_limits.shape[0]):
+        idx = np.flatnonzero(position == pos)
+        slots = int(pos_limits[pos])
+        if idx.size < slots:
+            return np.empty(0, dtype=np.int64)
+        best, take = position_table(int_cost[idx], score[idx], slots, budget)
+        members.append((idx, take, slots))
+        if combined is None:
+            combined = best[slots]
+        else:
+            combined, split = _combine(combined, best[slots])
+            splits.append(split)
+    
+    if not np.isfinite(combined).any():
+        return np.empty(0, dtype=np.int64)
+    
+    # Unwind the spend per position from the best total
+    spend = [0] * len(members)
+    b = int(np.argmax(combined))
+    for pos in range(len(members) - 1, 0, -1):
+        b_left = int(splits[pos - 1][b])
+        spend[pos] = b - b_left
+        b = b_left
+    spend[0] = b
+    
+    selected = []
+    for (idx, take, k), b in zip(members, spend):
+        for j in range(idx.size - 1, -1, -1):
+            if k == 0:
+                break
+            if take[j, k, b]:
+                selected.append(idx[j])
+                k -= 1
+                b -= int_cost[idx[j]]
+    
+    return _enforce_team_limit(
+        np.sort(np.array(selected, dtype=np.int64)), position, int_cost, score, team,
+        team_limit, num_teams, budget
+    )
+
+
+if _NUMBA_AVAILABLE:
+    # nogil lets generate_all_strategies run the kernels side by side in threads.
+    # Compiled on first call, not at import; cache=True persists the machine
+    # code so later processes load it instead of recompiling
+    greedy_select = njit(cache=True, nogil=True)(_greedy_select_loop)
+    position_table = njit(cache=True, nogil=True)(_position_table_loop)
+else:
+    greedy_select = _greedy_select_loop
+    position_table = _position_table_numpy
@@ -11,9 +11,38 @@ Example:
     >>> generator = BestTeamGenerator()
     >>> best_squad = generator.generate_best_team(players_df)
 """
+import copy
+import hashlib
+import threading
+import numpy as np
 import pandas as pd
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 from utils.error_handling import logger
+from utils._squad_kernel import greedy_select, optimal_select
+
+
+@dataclass
+class _PreparedPlayers:
+    """Player columns extracted, coerced and encoded once per input frame"""
+    # Raw values, reported as-is for selected players
+    web_name: np.ndarray
+    position: np.ndarray
+    team_name: np.ndarray
+    total_points: np.ndarray
+    form: np.ndarray
+    ownership: np.ndarray
+    # Coerced numeric inputs for scoring
+    points_num: np.ndarray
+    form_num: np.ndarray
+    cost_millions: np.ndarray
+    # Selection kernel inputs
+    cost_tenths: np.ndarray
+    pos_code: np.ndarray
+    team_code: np.ndarray
+    num_teams: int
 
 
 class BestTeamGenerator:
@@ -34,10 +63,26 @@ class BestTeamGenerator:
         'FWD': 3
     }
     MAX_PER_TEAM = 3
+    STRATEGIES = ['balanced', 'form', 'value', 'points']
+    
+    # Columns that determine a generated team, hashed to recognise repeat inputs
+    FINGERPRINT_COLUMNS = [
+        'web_name', 'position', 'now_cost', 'team', 'team_name',
+        'total_points', 'form', 'selected_by_percent'
+    ]
+    RESULT_CACHE_SIZE = 8
+    
+    # Shared across instances, since pages build a fresh generator per rerun:
+    # (frame fingerprint, strategy) -> result, least recently used first
+    _result_cache: "OrderedDict[Tuple[bytes, str], Dict]" = OrderedDict()
+    _result_cache_lock = threading.Lock()
     
     def __init__(self):
         """Initialize the best team generator."""
         self.logger = logger
+        # Last prepared frame as (content fingerprint, arrays); one tuple so
+        # threads never pair a fingerprint with another frame's arrays
+        self._prepared = None
     
     def generate_best_team(
         self,
@@ -50,7 +95,7 @@ class BestTeamGenerator:
         Args:
             df: DataFrame with player data
             strategy: 'balanced', 'form', 'value', or 'points'
-            
+        
         Returns:
             Dict with:
                 - squad: List of 15 player dicts
@@ -65,30 +110,41 @@ class BestTeamGenerator:
             if not all(col in df.columns for col in required_cols):
                 raise ValueError(f"Missing required columns. Need: {required_cols}")
             
+            # Same player data and strategy as a recent call: reuse its result
+            fingerprint = self._frame_fingerprint(df)
+            cache_key = (fingerprint, strategy)
+            with self._result_cache_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+            
+            # Coerce and encode the columns once; repeat calls on the same data reuse them
+            prepared = self._prepare_frame(df, fingerprint)
+            
             # Calculate selection score based on strategy
-            df = df.copy()
-            df['selection_score'] = self._calculate_selection_score(df, strategy)
+            selection_score = self._calculate_selection_score(prepared, strategy)
             
-            # Sort by selection score
-            df = df.sort_values('selection_score', ascending=False)
+            # Order by selection score; only the permutation is needed, not a sorted frame
+            order = np.argsort(-selection_score, kind='stable')
             
             # Select best squad within constraints
-            squad = self._select_optimal_squad(df)
+            squad = self._select_optimal_squad(prepared, order, selection_score)
             
             if not squad:
                 return self._get_empty_result()
             
-            # Calculate squad statistics
-            squad_df = pd.DataFrame(squad)
-            total_cost = squad_df['now_cost'].sum() / 10  # Convert to millions
+            # Calculate squad cost
+            total_cost = sum(p['now_cost'] for p in squad) / 10  # Convert to millions
             
             # Determine best starting XI and bench
             starting_xi, bench, formation = self._select_starting_xi(squad)
             
             # Calculate statistics
-            stats = self._calculate_squad_stats(squad_df, starting_xi, bench)
+            stats = self._calculate_squad_stats(squad, starting_xi, bench)
             
-            return {
+            result = {
                 'squad': squad,
                 'total_cost': round(total_cost, 1),
                 'starting_xi': starting_xi,
@@ -98,32 +154,133 @@ class BestTeamGenerator:
                 'strategy': strategy
             }
             
+            # Cache a private copy so callers can't alter what later calls get
+            cached = copy.deepcopy(result)
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = cached
+                if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+            
+            return result
+        
         except Exception as e:
             self.logger.error(f"Error generating best team: {e}")
             return self._get_empty_result()
     
+    def generate_all_strategies(self, df: pd.DataFrame) -> Dict[str, Dict]:
+        """
+        Generate the best squad for every strategy.
+        
+        The frame is prepared once, then the strategies run on a thread pool;
+        the selection kernels release the GIL when compiled with numba.
+        
+        Args:
+            df: DataFrame with player data
+        
+        Returns:
+            Dict mapping each strategy to its generate_best_team() result
+        """
+        try:
+            self._prepare_frame(df, self._frame_fingerprint(df))
+        except Exception:
+            pass  # Each strategy reports the problem through generate_best_team
+        
+        with ThreadPoolExecutor(max_workers=len(self.STRATEGIES)) as pool:
+            results = pool.map(lambda strategy: self.generate_best_team(df, strategy), self.STRATEGIES)
+            return dict(zip(self.STRATEGIES, results))
+    
+    def _frame_fingerprint(self, df: pd.DataFrame) -> bytes:
+        """
+        Hash the columns that determine the generated team.
+        
+        Values are hashed per row with pandas, so equal data in different
+        frame objects gives the same fingerprint.
+        
+        Args:
+            df: Player DataFrame
+        
+        Returns:
+            16-byte digest
+        """
+        columns = [col for col in self.FINGERPRINT_COLUMNS if col in df.columns]
+        row_hashes = pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+        digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+        digest.update(repr(columns).encode())
+        return digest.digest()
+    
+    def _prepare_frame(self, df: pd.DataFrame, fingerprint: bytes) -> _PreparedPlayers:
+        """
+        Extract, coerce and encode the player columns used for selection.
+        
+        The result is kept for the last fingerprint seen, so scoring the same
+        data under several strategies pays for the conversion once, while a
+        frame edited in place is prepared again.
+        
+        Args:
+            df: Player DataFrame
+            fingerprint: _frame_fingerprint(df)
+        
+        Returns:
+            Prepared player arrays
+        """
+        last = self._prepared
+        if last is not None and last[0] == fingerprint:
+            return last[1]
+        
+        n = len(df)
+        team = df['team'].to_numpy()
+        now_cost = df['now_cost'].to_numpy()
+        
+        # Ensure numeric types for scoring
+        points_num = pd.to_numeric(df['total_points'], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+        form_num = pd.to_numeric(df['form'], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+        cost_millions = pd.to_numeric(df['now_cost'], errors='coerce').fillna(40).to_numpy(dtype=np.float64) / 10
+        cost_millions[cost_millions == 0] = 999  # Avoid division by zero
+        
+        # Int-encode positions (-1 for any not in the squad) and teams (-1 for missing)
+        position = df['position'].to_numpy()
+        pos_code = pd.Categorical(position, categories=list(self.POSITIONS)).codes.astype(np.int64)
+        team_code, team_uniques = pd.factorize(df['team'])
+        
+        prepared = _PreparedPlayers(
+            web_name=df['web_name'].to_numpy(),
+            position=position,
+            team_name=df['team_name'].to_numpy() if 'team_name' in df.columns else team,
+            total_points=df['total_points'].to_numpy(),
+            form=df['form'].to_numpy(),
+            ownership=df['selected_by_percent'].to_numpy() if 'selected_by_percent' in df.columns else np.zeros(n),
+            points_num=points_num,
+            form_num=form_num,
+            cost_millions=cost_millions,
+            cost_tenths=now_cost.astype(np.float64),
+            pos_code=pos_code,
+            team_code=team_code.astype(np.int64),
+            num_teams=len(team_uniques)
+        )
+        
+        self._prepared = (fingerprint, prepared)
+        return prepared
+    
     def _calculate_selection_score(
         self,
-        df: pd.DataFrame,
+        prepared: _PreparedPlayers,
         strategy: str
-    ) -> pd.Series:
+    ) -> np.ndarray:
         """
         Calculate selection score for each player based on strategy.
         
         Args:
-            df: Player DataFrame
+            prepared: Prepared player arrays
             strategy: Selection strategy
-            
+        
         Returns:
-            Series with selection scores
+            Array with selection scores
         """
-        # Ensure numeric types
-        points = pd.to_numeric(df['total_points'], errors='coerce').fillna(0)
-        form = pd.to_numeric(df['form'], errors='coerce').fillna(0)
-        cost = pd.to_numeric(df['now_cost'], errors='coerce').fillna(40) / 10  # To millions
+        points = prepared.points_num
+        form = prepared.form_num
         
         # Value score (points per million)
-        value = points / cost.replace(0, 999)  # Avoid division by zero
+        value = points / prepared.cost_millions
         
         if strategy == 'form':
             # Prioritize in-form players
@@ -138,59 +295,104 @@ class BestTeamGenerator:
             # Balanced approach
             return points * 0.4 + form * 5 + value * 0.6
     
-    def _select_optimal_squad(self, df: pd.DataFrame) -> List[Dict]:
+    def _squad_candidates(
+        self,
+        prepared: _PreparedPlayers,
+        pos_limits: np.ndarray,
+        budget: float
+    ) -> np.ndarray:
+        """
+        Mask of players that fit into some complete squad.
+        
+        A player is dropped if their position is outside the squad, or if
+        they cost more than the budget left after filling every other slot
+        at its position's cheapest price. When no complete squad is
+        affordable at all, every squad position is kept so the greedy pick
+        can still return a partial squad.
+        
+        Args:
+            prepared: Prepared player arrays
+            pos_limits: Players needed per position code
+            budget: Budget in 0.1m units
+        
+        Returns:
+            Boolean mask over players
+        """
+        pos_code = prepared.pos_code
+        cost = prepared.cost_tenths
+        in_squad = pos_code >= 0
+        
+        counts = np.bincount(pos_code[in_squad], minlength=len(pos_limits))
+        if (counts < pos_limits).any():
+            return in_squad
+        
+        min_cost = np.full(len(pos_limits), np.inf)
+        np.minimum.at(min_cost, pos_code[in_squad], cost[in_squad])
+        cheapest_squad = float((pos_limits * min_cost).sum())
+        if cheapest_squad > budget:
+            return in_squad
+        
+        # Most a player of each position may cost with the rest filled cheaply
+        max_cost = budget - cheapest_squad + min_cost
+        return in_squad & (cost <= max_cost[np.maximum(pos_code, 0)])
+    
+    def _select_optimal_squad(
+        self,
+        prepared: _PreparedPlayers,
+        order: np.ndarray,
+        selection_score: np.ndarray
+    ) -> List[Dict]:
         """
         Select optimal 15-player squad within all constraints.
         
         Args:
-            df: Sorted DataFrame by selection score
-            
+            prepared: Prepared player arrays
+            order: Player positions, best selection score first
+            selection_score: Selection score per player
+        
         Returns:
             List of 15 player dictionaries
         """
-        squad = []
-        remaining_budget = self.BUDGET * 10  # Convert to 0.1m units
-        positions_needed = self.POSITIONS.copy()
-        team_counts = {}
-        
-        for _, player in df.iterrows():
-            # Check if position is still needed
-            position = player['position']
-            if positions_needed.get(position, 0) <= 0:
-                continue
-            
-            # Check budget
-            cost = float(player['now_cost'])
-            if cost > remaining_budget:
-                continue
-            
-            # Check team limit
-            team = player['team']
-            if team_counts.get(team, 0) >= self.MAX_PER_TEAM:
-                continue
-            
-            # Add player to squad
-            squad.append({
-                'web_name': player['web_name'],
-                'position': position,
-                'team': player.get('team_name', team),
-                'now_cost': cost,
-                'total_points': float(player.get('total_points', 0)),
-                'form': float(player.get('form', 0)),
-                'selection_score': float(player.get('selection_score', 0)),
-                'selected_by_percent': float(player.get('selected_by_percent', 0))
-            })
-            
-            # Update constraints
-            remaining_budget -= cost
-            positions_needed[position] -= 1
-            team_counts[team] = team_counts.get(team, 0) + 1
-            
-            # Check if squad is complete
-            if len(squad) == 15:
-                break
+        pos_limits = np.array(list(self.POSITIONS.values()), dtype=np.int64)
+        budget = self.BUDGET * 10  # Convert to 0.1m units
+        
+        # Only candidates that can appear in a complete squad reach the pickers
+        order = order[self._squad_candidates(prepared, pos_limits, budget)[order]]
+        
+        position = prepared.pos_code[order]
+        cost = prepared.cost_tenths[order]
+        team = prepared.team_code[order]
+        score = selection_score[order]
         
-        return squad
+        # Exact knapsack pick; returned in score order like the greedy one
+        picked = optimal_select(
+            position, cost, score, team, pos_limits,
+            self.MAX_PER_TEAM, prepared.num_teams, budget
+        )
+        
+        # Greedy pick in score order under budget, position and team limits. It is
+        # the fallback, and wins when the team limit repair left the exact pick behind
+        greedy = greedy_select(
+            position, cost, team, pos_limits, self.MAX_PER_TEAM,
+            prepared.num_teams, budget, 15
+        )
+        if len(picked) < 15 or (len(greedy) == 15 and score[greedy].sum() > score[picked].sum()):
+            picked = greedy
+        
+        # Build dicts only for the selected players
+        return [
+            {
+                'web_name': prepared.web_name[i],
+                'position': prepared.position[i],
+                'team': prepared.team_name[i],
+                'now_cost': float(prepared.cost_tenths[i]),
+                'total_points': float(prepared.total_points[i]),
+                'form': float(prepared.form[i]),
+                'selection_score': float(selection_score[i]),
+                'selected_by_percent': float(prepared.ownership[i])
+            }
+            for i in order[picked].tolist()
+        ]
     
     def _select_starting_xi(
         self,
@@ -201,7 +403,7 @@ class BestTeamGenerator:
         
         Args:
             squad: 15-player squad
-            
+        
         Returns:
             Tuple of (starting_xi, bench, formation)
         """
@@ -218,16 +420,14 @@ class BestTeamGenerator:
         
         # Select starting XI (must have at least 1 GK, 3 DEF, 2 MID, 1 FWD)
         starting_xi = []
-        bench = []
         
         # Always start top GK
         if 'GKP' in by_position and len(by_position['GKP']) > 0:
             starting_xi.append(by_position['GKP'][0])
-            bench.extend(by_position['GKP'][1:])
         
-        # Determine best formation from available players
+        # Determine best formation from available players; everyone else is on the bench
         formations = self._get_valid_formations()
-        best_formation = self._find_best_formation(
+        best_formation, bench = self._find_best_formation(
             by_position, formations, starting_xi
         )
         
@@ -250,7 +450,7 @@ class BestTeamGenerator:
         by_position: Dict[str, List[Dict]],
         formations: List[Tuple[int, int, int]],
         starting_xi: List[Dict]
-    ) -> str:
+    ) -> Tuple[str, List[Dict]]:
         """
         Find the best formation based on available players.
         
@@ -258,54 +458,58 @@ class BestTeamGenerator:
             by_position: Players grouped by position
             formations: Valid formations
             starting_xi: Current starting XI (will be modified)
-            
+        
         Returns:
-            Formation string (e.g., "3-4-3")
+            Tuple of (formation string e.g. "3-4-3", bench players by score)
         """
         best_score = 0
         best_formation = "3-4-3"
-        best_xi = starting_xi.copy()
-        
-        for def_count, mid_count, fwd_count in formations:
-            # Check if we have enough players
-            if (len(by_position.get('DEF', [])) < def_count or
-                len(by_position.get('MID', [])) < mid_count or
-                len(by_position.get('FWD', [])) < fwd_count):
-                continue
-            
-            # Calculate formation score
-            xi = starting_xi.copy()  # Start with GK
-            
-            # Add outfield players
-            xi.extend(by_position['DEF'][:def_count])
-            xi.extend(by_position['MID'][:mid_count])
-            xi.extend(by_position['FWD'][:fwd_count])
-            
-            # Calculate total score
-            score = sum(p['selection_score'] for p in xi)
-            
-            if score > best_score:
-                best_score = score
-                best_formation = f"{def_count}-{mid_count}-{fwd_count}"
-                best_xi = xi
+        best_counts = None
         
-        # Update starting XI
-        starting_xi.clear()
-        starting_xi.extend(best_xi)
+        # Top-k score prefix sums per position, so each formation is scored in O(1)
+        cum = {
+            pos: np.cumsum([p['selection_score'] for p in by_position.get(pos, [])])
+            for pos in ('DEF', 'MID', 'FWD')
+        }
+        gk_score = sum(p['selection_score'] for p in starting_xi)
+        
+        # Check every formation against the available players at once
+        shapes = np.array(formations, dtype=np.int64)
+        counts = np.array([len(cum['DEF']), len(cum['MID']), len(cum['FWD'])])
+        feasible = shapes[(shapes <= counts).all(axis=1)]
+        
+        if len(feasible) > 0:
+            # Formation scores: GK plus the top players of each outfield line
+            scores = (gk_score + cum['DEF'][feasible[:, 0] - 1] +
+                      cum['MID'][feasible[:, 1] - 1] + cum['FWD'][feasible[:, 2] - 1])
+            best = int(scores.argmax())  # First of equal scores, as listed
+            if scores[best] > best_score:
+                best_score = scores[best]
+                best_counts = tuple(int(c) for c in feasible[best])
+                best_formation = "-".join(str(c) for c in best_counts)
+        
+        # Update starting XI (GK already in place)
+        if best_counts is not None:
+            def_count, mid_count, fwd_count = best_counts
+            starting_xi.extend(by_position['DEF'][:def_count])
+            starting_xi.extend(by_position['MID'][:mid_count])
+            starting_xi.extend(by_position['FWD'][:fwd_count])
         
         # Set bench (remaining players not in starting XI)
         all_players = []
         for players in by_position.values():
             all_players.extend(players)
         
-        bench_players = [p for p in all_players if p not in starting_xi]
+        # Identity set: one hash lookup per player instead of dict equality scans
+        xi_ids = {id(p) for p in starting_xi}
+        bench_players = [p for p in all_players if id(p) not in xi_ids]
         bench_players.sort(key=lambda x: x['selection_score'], reverse=True)
         
-        return best_formation
+        return best_formation, bench_players
     
     def _calculate_squad_stats(
         self,
-        squad_df: pd.DataFrame,
+        squad: List[Dict],
         starting_xi: List[Dict],
         bench: List[Dict]
     ) -> Dict:
@@ -313,22 +517,21 @@ class BestTeamGenerator:
         Calculate squad statistics.
         
         Args:
-            squad_df: Squad DataFrame
+            squad: 15-player squad
             starting_xi: Starting XI players
             bench: Bench players
-            
+        
         Returns:
             Dict with squad statistics
         """
-        starting_df = pd.DataFrame(starting_xi) if starting_xi else pd.DataFrame()
-        
+        # Aggregate the 15 player dicts directly; no pandas dispatch needed at this size
         return {
-            'total_points': int(squad_df['total_points'].sum()),
-            'avg_form': round(squad_df['form'].mean(), 2),
-            'starting_xi_points': int(starting_df['total_points'].sum()) if len(starting_df) > 0 else 0,
+            'total_points': int(sum(p['total_points'] for p in squad)),
+            'avg_form': round(np.mean([p['form'] for p in squad]), 2),
+            'starting_xi_points': int(sum(p['total_points'] for p in starting_xi)),
             'bench_points': int(sum(p['total_points'] for p in bench)),
-            'avg_ownership': round(squad_df['selected_by_percent'].mean(), 1),
-            'team_distribution': squad_df.groupby('team').size().to_dict()
+            'avg_ownership': round(np.mean([p['selected_by_percent'] for p in squad]), 1),
+            'team_distribution': dict(Counter(p['team'] for p in squad))
         }
     
     def _get_empty_result(self) -> Dict:
@@ -356,7 +559,7 @@ class BestTeamGenerator:
         
         Args:
             result: Result from generate_best_team()
-            
+        
         Returns:
             Formatted string for display
         """
@@ -397,7 +600,7 @@ def generate_best_team(df: pd.DataFrame, strategy: str = 'balanced') -> Dict:
     Args:
         df: Player DataFrame
         strategy: 'balanced', 'form', 'value', or 'points'
-        
+    
     Returns:
         Dict with squad details
     """
@@ -2,11 +2,19 @@
 Safe Data Conversion Utilities for FPL Analytics
 Handles data type conversions with error-tolerant fallbacks
 """
+import math
 import pandas as pd
 import numpy as np
 from typing import Any, Union, Optional
 
 
+def _is_plain_number(value: Any) -> bool:
+    """True for non-NaN int/float scalars, which need no pandas parsing"""
+    if isinstance(value, (float, np.floating)):
+        return not math.isnan(value)
+    return isinstance(value, (int, np.integer))
+
+
 def safe_int_convert(value: Any, default: int = 0) -> int:
     """
     Safely convert a value to integer with fallback.
@@ -27,6 +35,15 @@ def safe_int_convert(value: Any, default: int = 0) -> int:
         12
     """
     try:
+        # Fast path: numbers skip pd.isna/pd.to_numeric dispatch; exact
+        # builtin types first, NaN via IEEE self-inequality
+        value_type = type(value)
+        if value_type is int:
+            return value
+        if value_type is float:
+            return default if value != value else int(value)
+        if _is_plain_number(value):
+            return int(value)
         if pd.isna(value):
             return default
         numeric_value = pd.to_numeric(value, errors='coerce')
@@ -49,6 +66,15 @@ def safe_float_convert(value: Any, default: float = 0.0) -> float:
         Float value or default
     """
     try:
+        # Fast path: numbers skip pd.isna/pd.to_numeric dispatch; exact
+        # builtin types first, NaN via IEEE self-inequality
+        value_type = type(value)
+        if value_type is float:
+            return default if value != value else value
+        if value_type is int:
+            return float(value)
+        if _is_plain_number(value):
+            return float(value)
         if pd.isna(value):
             return default
         numeric_value = pd.to_numeric(value, errors='coerce')
@@ -71,6 +97,13 @@ def safe_percentage_convert(value: Any, default: float = 0.0) -> float:
         Float percentage value or default
     """
     try:
+        # Fast path: numbers need neither stripping nor parsing
+        value_type = type(value)
+        if value_type is float:
+            return default if value != value else value
+        if value_type is int:
+            return float(value)
+        
         if pd.isna(value):
             return default
         
@@ -86,9 +119,22 @@ def safe_percentage_convert(value: Any, default: float = 0.0) -> float:
         return default
 
 
+def _smallest_int_dtype(values: pd.Series) -> type:
+    """Narrowest of int16/int32/int64 that holds every value"""
+    if values.empty:
+        return np.int16
+    low, high = values.min(), values.max()
+    for candidate in (np.int16, np.int32):
+        info = np.iinfo(candidate)
+        if info.min <= low and high <= info.max:
+            return candidate
+    return np.int64
+
+
 def clean_numeric_column(df: pd.DataFrame, column: str, 
                         dtype: str = 'float', 
-                        default: Union[int, float] = 0) -> pd.DataFrame:
+                        default: Union[int, float] = 0,
+                        downcast: bool = False) -> pd.DataFrame:
     """
     Clean and convert a DataFrame column to numeric type safely.
     
@@ -97,22 +143,23 @@ def clean_numeric_column(df: pd.DataFrame, column: str,
         column: Column name to clean
         dtype: Target dtype ('int' or 'float')
         default: Default value for invalid entries
+        downcast: Store ints as the narrowest of int16/int32 that fits and
+            floats as float32 (e.g. now_cost, total_points, form)
         
     Returns:
-        DataFrame with cleaned column
+        New DataFrame with cleaned column (the input is left unchanged)
     """
     if column not in df.columns:
         return df
     
-    df = df.copy()
-    df[column] = pd.to_numeric(df[column], errors='coerce').fillna(default)
-    
+    cleaned = pd.to_numeric(df[column], errors='coerce').fillna(default)
     if dtype == 'int':
-        df[column] = df[column].astype(int)
+        cleaned = cleaned.astype(_smallest_int_dtype(cleaned) if downcast else int)
     else:
-        df[column] = df[column].astype(float)
+        cleaned = cleaned.astype(np.float32 if downcast else float)
     
-    return df
+    # assign replaces just this column instead of copying the whole frame
+    return df.assign(**{column: cleaned})
 
 
 def format_price(value: Any, default: str = "£0.0m") -> str:
@@ -211,7 +258,16 @@ def safe_dict_get(dictionary: dict, key: str,
     """
     value = dictionary.get(key, default)
     
-    if value is None or pd.isna(value):
+    if value is None:
+        return default
+    
+    # Plain floats only need the NaN self-check; ints and strings are never
+    # missing, so pd.isna is left for pandas/NumPy NA types
+    value_type = type(value)
+    if value_type is float:
+        if value != value:
+            return default
+    elif value_type not in (int, str, bool) and pd.isna(value):
         return default
     
     if convert_type is None:
@@ -5,14 +5,314 @@ This module generates comprehensive API documentation using Sphinx and provides
 utilities for maintaining up-to-date documentation.
 """
 
-import inspect
-import importlib
-import pkgutil
-from pathlib import Path
-from typing import Dict, List, Any, Optional
+import functools
 import json
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import os
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Any, Optional
+from dataclasses import dataclass
+
+# inspect and importlib are imported inside the methods that use them
+
+# RST heading underlines by (character, length); titles repeat across endpoints
+_UNDERLINE_CACHE: Dict[tuple, str] = {}
+
+
+def _underline(char: str, text: str) -> str:
+    """RST underline of char matching the length of text."""
+    key = (char, len(text))
+    underline = _UNDERLINE_CACHE.get(key)
+    if underline is None:
+        underline = _UNDERLINE_CACHE[key] = char * len(text)
+    return underline
+
+
+# Module -> {source file: mtime (ns)} of the last run, kept in the docs directory
+MANIFEST_FILE = ".doc_manifest.json"
+# Manifest entry invalidating everything when this generator itself changes
+_GENERATOR_KEY = "__generator__"
+
+
+# Files modified this close to (or after) the start of a run may have been
+# read in their previous state; covers coarse filesystem timestamps
+_MTIME_SLACK_NS = 2_000_000_000
+
+# Interpreter and installed packages; base classes from there aren't tracked
+_INSTALLED_PREFIXES = tuple({sys.prefix, sys.base_prefix, sys.exec_prefix})
+
+
+def _generator_mtime() -> int:
+    """mtime (ns) of this file; RST written by another version is regenerated."""
+    return os.stat(__file__).st_mtime_ns
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_getdoc(obj) -> Optional[str]:
+    """inspect.getdoc, memoized per object (inherited lookups and cleandoc run once)."""
+    import inspect
+    
+    return inspect.getdoc(obj)
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _annotation_str(annotation) -> str:
+    """str() of an annotation, memoized; the same few types repeat across signatures."""
+    return str(annotation)
+
+
+def _format_annotation(annotation) -> str:
+    """Memoized str() of an annotation, computed directly when it isn't hashable."""
+    try:
+        return _annotation_str(annotation)
+    except TypeError:
+        return str(annotation)
+
+
+# Static documents, written as-is on every run
+_CONFIG_RST = """\
+Configuration Guide
+==================
+
+This guide explains how to configure the FPL Analytics application.
+
+Environment Variables
+-------------------
+
+The application uses the following environment variables:
+
+API Configuration
+^^^^^^^^^^^^^^^^
+
+- ``FPL_API_URL``: Base URL for FPL API (default: https://fantasy.premierleague.com/api)
+- ``FPL_API_TIMEOUT``: Request timeout in seconds (default: 30)
+- ``FPL_API_RETRIES``: Number of retry attempts (default: 3)
+
+Cache Configuration
+^^^^^^^^^^^^^^^^^
+
+- ``CACHE_TTL``: Cache time-to-live in seconds (default: 3600)
+- ``REDIS_URL``: Redis connection URL for caching (optional)
+
+Security Configuration
+^^^^^^^^^^^^^^^^^^^^
+
+- ``SECRET_KEY``: Application secret key (required for production)
+- ``JWT_SECRET``: JWT signing secret (required for authentication)
+- ``ENABLE_HTTPS``: Enable HTTPS (default: False)
+
+Example Configuration
+-------------------
+
+Create a ``.env`` file in your project root:
+
+.. code-block:: bash
+
+   # API Configuration
+   FPL_API_URL=https://fantasy.premierleague.com/api
+   FPL_API_TIMEOUT=30
+
+   # Cache Configuration
+   CACHE_TTL=3600
+   REDIS_URL=redis://localhost:6379/0
+
+   # Security (Production)
+   SECRET_KEY=your-secret-key-here
+   JWT_SECRET=your-jwt-secret-here
+   ENABLE_HTTPS=true"""
+
+_USER_GUIDE_RST = """\
+User Guide
+==========
+
+This guide provides step-by-step instructions for using the FPL Analytics application.
+
+Getting Started
+---------------
+
+Installation
+^^^^^^^^^^^
+
+1. Clone the repository:
+
+.. code-block:: bash
+
+   git clone https://github.com/your-username/fpl-analytics.git
+   cd fpl-analytics
+
+2. Install dependencies:
+
+.. code-block:: bash
+
+   pip install -r requirements.txt
+
+3. Run the application:
+
+.. code-block:: bash
+
+   streamlit run main_modular.py
+
+Basic Usage
+----------
+
+Dashboard Navigation
+^^^^^^^^^^^^^^^^^^
+
+The application provides several main pages:
+
+- **Dashboard**: Overview of key FPL metrics and insights
+- **Player Analysis**: Detailed analysis of individual players
+- **Team Builder**: Tools for optimizing your FPL team
+- **AI Recommendations**: Machine learning-powered player suggestions
+
+Data Services
+^^^^^^^^^^^^
+
+The application uses several data services:
+
+.. code-block:: python
+
+   from services.enhanced_fpl_data_service import EnhancedFPLDataService
+
+   # Initialize service
+   service = EnhancedFPLDataService()
+
+   # Test connection
+   if service.test_connection():
+       print('✅ Connected to FPL API')
+
+   # Get bootstrap data
+   bootstrap_data = service.get_bootstrap_data()
+
+   # Convert to DataFrame
+   players_df = service.get_players_dataframe()
+
+Advanced Features
+---------------
+
+Real-time Updates
+^^^^^^^^^^^^^^^
+
+Enable real-time data synchronization:
+
+.. code-block:: python
+
+   from features.realtime_sync import real_time_manager
+
+   # Start real-time sync
+   real_time_manager.start_sync()
+
+   # Subscribe to updates
+   def handle_price_changes(update):
+       print(f'Price change: {update.data}')
+
+   real_time_manager.subscribe(UpdateType.PRICE_CHANGES, handle_price_changes)
+
+Machine Learning Analytics
+^^^^^^^^^^^^^^^^^^^^^^^^
+
+Use ML models for player analysis:
+
+.. code-block:: python
+
+   from analytics.ml_engine import create_ml_analytics
+
+   # Create ML analytics instance
+   ml_analytics = create_ml_analytics('xgboost')
+
+   # Train models
+   model_results = ml_analytics.train_models(players_df)
+
+   # Make predictions
+   predictions = ml_analytics.predict_player_performance(players_df)
+
+Troubleshooting
+--------------
+
+Common Issues
+^^^^^^^^^^^
+
+**SSL Certificate Errors**
+
+If you encounter SSL certificate errors, the application automatically
+handles this by disabling SSL verification for the FPL API.
+
+**Cache Issues**
+
+To clear the cache:
+
+.. code-block:: python
+
+   from utils.advanced_cache_manager import get_cache_manager
+
+   cache_manager = get_cache_manager()
+   cache_manager.clear()
+
+**Performance Issues**
+
+Monitor performance using the built-in performance monitor:
+
+.. code-block:: python
+
+   from utils.enhanced_performance_monitor import get_performance_monitor
+
+   monitor = get_performance_monitor()
+   metrics = monitor.get_metrics()
+   print(metrics)"""
+
+_SPHINX_CONF_PY = '''# Configuration file for the Sphinx documentation builder.
+
+# -- Project information -----------------------------------------------------
+project = 'FPL Analytics'
+copyright = '2025, FPL Analytics Team'
+author = 'FPL Analytics Team'
+release = '1.0.0'
+
+# -- General configuration ---------------------------------------------------
+extensions = [
+    'sphinx.ext.autodoc',
+    'sphinx.ext.viewcode',
+    'sphinx.ext.napoleon',
+    'sphinx.ext.intersphinx',
+    'sphinx.ext.todo',
+    'sphinx.ext.coverage',
+    'sphinx.ext.mathjax',
+]
+
+templates_path = ['_templates']
+exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
+
+# -- Options for HTML output -------------------------------------------------
+html_theme = 'sphinx_rtd_theme'
+html_static_path = ['_static']
+
+# -- Extension configuration -------------------------------------------------
+# Napoleon settings
+napoleon_google_docstring = True
+napoleon_numpy_docstring = True
+napoleon_include_init_with_doc = False
+napoleon_include_private_with_doc = False
+
+# Autodoc settings
+autodoc_default_options = {
+    'members': True,
+    'member-order': 'bysource',
+    'special-members': '__init__',
+    'undoc-members': True,
+    'exclude-members': '__weakref__'
+}
+
+# Intersphinx mapping
+intersphinx_mapping = {
+    'python': ('https://docs.python.org/3/', None),
+    'pandas': ('https://pandas.pydata.org/docs/', None),
+    'numpy': ('https://numpy.org/doc/stable/', None),
+}
+'''
 
 
 @dataclass
@@ -61,9 +361,47 @@ class DocumentationGenerator:
             "features"
         ]
         
+        # Drop repeated and nested roots so no tree is walked twice
+        roots = sorted(set(self.modules_to_document))
+        self.modules_to_document = [
+            root for root in roots
+            if not any(root.startswith(other + "/") for other in roots)
+        ]
+        
+        # Imported modules and import failures, keyed by dotted name
+        self._import_cache: Dict[str, Any] = {}
+        self._failed_imports: Dict[str, ImportError] = {}
+        
+        # (function, bound-to) -> (signature or None if undocumented, docstring)
+        self._sig_cache: Dict[tuple, tuple] = {}
+        
         # Ensure docs directories exist
         self.docs_dir.mkdir(exist_ok=True)
         self.api_docs_dir.mkdir(exist_ok=True)
+        
+        # Output directory -> open directory descriptor, see _open_in
+        self._dir_fds: Dict[Path, int] = {}
+        self._dir_fds_lock = threading.Lock()
+    
+    def __del__(self):
+        for dir_fd in getattr(self, "_dir_fds", {}).values():
+            os.close(dir_fd)
+    
+    def _open_in(self, directory: Path, name: str, **kwargs):
+        """Open name in directory for writing, resolving it against a cached directory handle.
+        
+        Falls back to a plain path open where the platform lacks dir_fd support.
+        """
+        if os.open not in os.supports_dir_fd or not hasattr(os, "O_DIRECTORY"):
+            return open(directory / name, 'w', encoding='utf-8', **kwargs)
+        
+        with self._dir_fds_lock:
+            dir_fd = self._dir_fds.get(directory)
+            if dir_fd is None:
+                dir_fd = self._dir_fds[directory] = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        
+        return open(name, 'w', encoding='utf-8',
+                    opener=lambda path, flags: os.open(path, flags, dir_fd=dir_fd), **kwargs)
     
     def generate_complete_documentation(self) -> None:
         """Generate complete API documentation for the project."""
@@ -72,13 +410,77 @@ class DocumentationGenerator:
         # Generate module documentation
         all_modules = self._discover_modules()
         
+        # Stat every module's source before any is parsed or imported, so the
+        # manifest never records a save made after the source was read
+        run_start = time.time_ns()
+        start_mtimes = {}
         for module_name in all_modules:
+            path = self._module_file(module_name)
             try:
-                module_doc = self._document_module(module_name)
-                self._write_module_documentation(module_doc)
-                print(f"✅ Documented module: {module_name}")
+                start_mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                pass
+        
+        # Skip modules whose sources (own file and base class files) are
+        # unchanged since their RST was written
+        manifest = self._load_manifest()
+        stat_cache: Dict[str, Optional[int]] = dict(start_mtimes)
+        unchanged = {
+            module_name for module_name in all_modules
+            if self._sources_unchanged(manifest.get(module_name), stat_cache)
+            and (self.api_docs_dir / self._rst_file_name(module_name)).is_file()
+        }
+        to_document = [module_name for module_name in all_modules if module_name not in unchanged]
+        
+        # Modules whose RST needs no signatures are documented from source
+        static_docs = {}
+        for module_name in to_document:
+            module_doc = self._document_module_static(self._module_file(module_name), module_name)
+            if module_doc is not None:
+                static_docs[module_name] = module_doc
+        
+        # Import the rest sequentially first: imports hold the import lock and
+        # run module-level code, so only introspection and writing fan out
+        setup_errors = {}
+        for module_name in to_document:
+            if module_name in static_docs:
+                continue
+            try:
+                self._cached_import(module_name)
+            except ImportError:
+                pass  # Re-raised with context by _document_module
             except Exception as e:
-                print(f"❌ Error documenting {module_name}: {e}")
+                setup_errors[module_name] = e
+        
+        def document(module_name: str) -> Dict[str, int]:
+            module_doc = static_docs.get(module_name)
+            if module_doc is None:
+                if module_name in setup_errors:
+                    raise setup_errors[module_name]
+                module_doc = self._document_module(module_name)
+            self._write_module_documentation(module_doc)
+            return self._source_mtimes(module_name, module_doc, module_name not in static_docs,
+                                       start_mtimes, run_start)
+        
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(document, name) for name in to_document}
+            
+            # Report in module order, as each finishes; failed modules are
+            # left out of the manifest so the next run retries them
+            new_manifest = {}
+            for module_name in all_modules:
+                if module_name in unchanged:
+                    new_manifest[module_name] = manifest[module_name]
+                    print(f"⏭️ Unchanged module: {module_name}")
+                    continue
+                try:
+                    new_manifest[module_name] = futures[module_name].result()
+                    print(f"✅ Documented module: {module_name}")
+                except Exception as e:
+                    print(f"❌ Error documenting {module_name}: {e}")
+        
+        self._save_manifest(new_manifest)
         
         # Generate index documentation
         self._generate_index_documentation(all_modules)
@@ -91,44 +493,276 @@ class DocumentationGenerator:
         
         print("✅ Documentation generation complete!")
     
+    def _source_mtimes(self, module_name: str, module_doc: ModuleDocumentation,
+                       imported: bool, start_mtimes: Dict[str, int],
+                       run_start: int) -> Dict[str, int]:
+        """Source files a module's RST was built from, with their mtimes (ns).
+        
+        Besides the module's own file this covers every class in the MRO of
+        its documented classes, since _document_class emits inherited
+        methods. Files of the interpreter and installed packages are left
+        out. Statically documented modules have no base classes.
+        
+        Mtimes come from start_mtimes, taken before any source was read. A
+        file not stat'ed then, or modified since the run began, is recorded
+        as -1 so the next run rebuilds the module.
+        """
+        own_file = self._module_file(module_name)
+        paths = {own_file}
+        if imported:
+            module = self._cached_import(module_name)
+            for class_name in module_doc.classes:
+                for klass in getattr(module, class_name).__mro__:
+                    path = getattr(sys.modules.get(klass.__module__), '__file__', None)
+                    if path and not path.startswith(_INSTALLED_PREFIXES):
+                        paths.add(path)
+        
+        mtimes = {}
+        for path in paths:
+            mtime = start_mtimes.get(path)
+            if mtime is None:
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    mtime = -1
+                if mtime >= run_start - _MTIME_SLACK_NS:
+                    mtime = -1
+            mtimes[path] = mtime
+        return mtimes
+    
+    @staticmethod
+    def _sources_unchanged(entry: Any, stat_cache: Dict[str, Optional[int]]) -> bool:
+        """True if every source file recorded in a manifest entry still has its mtime."""
+        if not isinstance(entry, dict) or not entry:
+            return False
+        
+        for path, mtime in entry.items():
+            if path not in stat_cache:
+                try:
+                    stat_cache[path] = os.stat(path).st_mtime_ns
+                except OSError:
+                    stat_cache[path] = None
+            if stat_cache[path] != mtime:
+                return False
+        return True
+    
+    def _load_manifest(self) -> Dict[str, Dict[str, int]]:
+        """Read the module -> {source file: mtime} manifest from the last run.
+        
+        Returns an empty manifest if there is none, it is unreadable, or it
+        was written by a different version of this generator.
+        """
+        try:
+            manifest = json.loads((self.docs_dir / MANIFEST_FILE).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(manifest, dict) or manifest.get(_GENERATOR_KEY) != _generator_mtime():
+            return {}
+        return manifest
+    
+    def _save_manifest(self, source_mtimes: Dict[str, Dict[str, int]]) -> None:
+        """Record the source file mtimes of every module whose RST is up to date."""
+        manifest = dict(source_mtimes)
+        manifest[_GENERATOR_KEY] = _generator_mtime()
+        with self._open_in(self.docs_dir, MANIFEST_FILE) as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+    
     def _discover_modules(self) -> List[str]:
         """Discover all Python modules in the project."""
         modules = []
+        root = str(self.project_root)
         
         for module_dir in self.modules_to_document:
-            module_path = self.project_root / module_dir
-            if module_path.exists() and module_path.is_dir():
-                for file_path in module_path.rglob("*.py"):
-                    if file_path.name != "__init__.py":
-                        # Convert file path to module name
-                        relative_path = file_path.relative_to(self.project_root)
-                        module_name = str(relative_path.with_suffix("")).replace("/", ".")
-                        modules.append(module_name)
-        
-        return sorted(modules)
+            module_path = os.path.join(root, module_dir)
+            if os.path.isdir(module_path):
+                for file_path in self._iter_py_files(module_path):
+                    # Convert file path to module name
+                    relative_path = os.path.relpath(file_path, root)
+                    modules.append(relative_path[:-3].replace(os.sep, "."))
+        
+        return sorted(set(modules))
+    
+    def _iter_py_files(self, root: str):
+        """Yield paths of .py files under root, skipping __init__.py and hidden directories."""
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not name.startswith("."):
+                            stack.append(entry.path)
+                    elif name.endswith(".py") and name != "__init__.py" and entry.is_file():
+                        yield entry.path
+    
+    @staticmethod
+    def _rst_file_name(module_name: str) -> str:
+        """Name of the RST file documenting module_name."""
+        return module_name.replace(".", "_") + ".rst"
+    
+    def _module_file(self, module_name: str) -> str:
+        """Source path of a discovered module."""
+        return os.path.join(str(self.project_root), *module_name.split(".")) + ".py"
+    
+    def _document_module_static(self, path: str, module_name: str) -> Optional[ModuleDocumentation]:
+        """Document a module from its source, without importing it.
+        
+        Only names are needed for the RST unless a member produces an API
+        endpoint, which needs a signature from the imported object. Returns
+        None, so the module is imported, whenever the source alone can't
+        show the imported module's members: documented functions or public
+        methods, decorators, base classes, conditional definitions, or
+        assignments that could create functions or classes.
+        
+        Args:
+            path: Path to the module source
+            module_name: Dotted module name
+        
+        Returns:
+            Module documentation, or None if the module must be imported
+        """
+        import ast
+        
+        try:
+            tree = ast.parse(Path(path).read_text(encoding='utf-8'))
+        except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+            return None
+        
+        classes = []
+        functions = []
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                # Documented functions become endpoints; decorators may swap the object
+                if node.decorator_list or ast.get_docstring(node):
+                    return None
+                functions.append(node.name)
+            elif isinstance(node, ast.ClassDef):
+                # Bases could contribute documented methods
+                if node.decorator_list or node.bases or node.keywords:
+                    return None
+                if not all(self._is_static_class_statement(item) for item in node.body):
+                    return None
+                classes.append(node.name)
+            elif not self._is_static_module_statement(node):
+                return None
+        
+        names = classes + functions
+        if len(set(names)) != len(names):
+            return None
+        
+        return ModuleDocumentation(
+            name=module_name,
+            description=ast.get_docstring(tree) or f"Documentation for {module_name}",
+            classes=sorted(classes),
+            functions=sorted(functions),
+            endpoints=[],
+            file_path=path
+        )
+    
+    @staticmethod
+    def _is_static_class_statement(node) -> bool:
+        """True if a class body statement adds no documented public method."""
+        import ast
+        
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            return node.name.startswith('_') or not (node.decorator_list or ast.get_docstring(node))
+        return DocumentationGenerator._is_static_value_statement(node)
+    
+    @staticmethod
+    def _is_static_module_statement(node) -> bool:
+        """True if a top-level statement can't define a function or class of the module."""
+        import ast
+        
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            return True
+        # The __main__ block doesn't run on import
+        test = node.test if isinstance(node, ast.If) else None
+        if (isinstance(test, ast.Compare) and isinstance(test.left, ast.Name) and
+                test.left.id == '__name__' and isinstance(test.ops[0], ast.Eq) and
+                isinstance(test.comparators[0], ast.Constant) and test.comparators[0].value == '__main__'):
+            return True
+        if isinstance(node, ast.Try):
+            blocks = node.body + node.orelse + node.finalbody
+            for handler in node.handlers:
+                blocks += handler.body
+            return all(DocumentationGenerator._is_static_module_statement(item) for item in blocks)
+        return DocumentationGenerator._is_static_value_statement(node)
+    
+    @staticmethod
+    def _is_static_value_statement(node) -> bool:
+        """True for docstrings, pass and assignments of literal values."""
+        import ast
+        
+        if isinstance(node, ast.Pass):
+            return True
+        if isinstance(node, ast.Expr):
+            return isinstance(node.value, ast.Constant)
+        if isinstance(node, (ast.Assign, ast.AnnAssign)):
+            if node.value is None:
+                return True
+            try:
+                ast.literal_eval(node.value)
+            except Exception:
+                return False
+            return True
+        return False
+    
+    def _cached_import(self, module_name: str):
+        """Import a module, reusing earlier imports and earlier failures."""
+        try:
+            module = sys.modules[module_name]
+        except KeyError:
+            pass
+        else:
+            # A module still initializing in another thread goes through
+            # import_module, which waits for it to finish
+            spec = getattr(module, "__spec__", None)
+            if module is not None and getattr(spec, "_initializing", False) is not True:
+                return module
+        
+        # Missing optional dependencies fail the same way every time
+        if module_name in self._failed_imports:
+            raise self._failed_imports[module_name]
+        
+        module = self._import_cache.get(module_name)
+        if module is None:
+            try:
+                import importlib
+                module = importlib.import_module(module_name)
+            except ImportError as e:
+                self._failed_imports[module_name] = e
+                raise
+            self._import_cache[module_name] = module
+        return module
     
     def _document_module(self, module_name: str) -> ModuleDocumentation:
         """Generate documentation for a specific module."""
         try:
-            module = importlib.import_module(module_name)
+            module = self._cached_import(module_name)
         except ImportError as e:
             raise ImportError(f"Could not import module {module_name}: {e}")
         
         # Extract module information
-        module_doc = inspect.getdoc(module) or f"Documentation for {module_name}"
+        module_doc = _cached_getdoc(module) or f"Documentation for {module_name}"
         
         classes = []
         functions = []
         endpoints = []
         
-        # Document classes and functions
-        for name, obj in inspect.getmembers(module):
-            if inspect.isclass(obj) and obj.__module__ == module_name:
+        # Document classes and functions; imported names are dropped on
+        # __module__ before any type check or sorting, the rest go in name order
+        defined_here = [
+            (name, obj) for name, obj in vars(module).items()
+            if getattr(obj, "__module__", None) == module_name
+        ]
+        for name, obj in sorted(defined_here):
+            if isinstance(obj, type):
                 classes.append(name)
                 class_endpoints = self._document_class(obj, module_name)
                 endpoints.extend(class_endpoints)
             
-            elif inspect.isfunction(obj) and obj.__module__ == module_name:
+            elif isinstance(obj, types.FunctionType):
                 functions.append(name)
                 function_endpoint = self._document_function(obj, module_name)
                 if function_endpoint:
@@ -145,20 +779,34 @@ class DocumentationGenerator:
     
     def _document_class(self, cls, module_name: str) -> List[APIEndpoint]:
         """Document a class and its methods."""
+        import inspect
+        
         endpoints = []
+        methods = []
+        functions = []
         
-        for method_name, method in inspect.getmembers(cls, inspect.ismethod):
-            if not method_name.startswith('_'):  # Skip private methods
-                endpoint = self._document_method(method, module_name, cls.__name__)
-                if endpoint:
-                    endpoints.append(endpoint)
+        # One walk over the MRO; the first class defining a name wins, as with getattr
+        seen = set()
+        for klass in cls.__mro__:
+            for method_name in vars(klass):
+                if method_name.startswith('_') or method_name in seen:  # Skip private methods
+                    continue
+                seen.add(method_name)
+                try:
+                    method = getattr(cls, method_name)
+                except AttributeError:
+                    continue
+                if inspect.ismethod(method):
+                    methods.append((method_name, method))
+                elif inspect.isfunction(method):
+                    # Also document regular functions in the class
+                    functions.append((method_name, method))
         
-        # Also document regular functions in the class
-        for method_name, method in inspect.getmembers(cls, inspect.isfunction):
-            if not method_name.startswith('_'):
-                endpoint = self._document_method(method, module_name, cls.__name__)
-                if endpoint:
-                    endpoints.append(endpoint)
+        # Bound (class) methods first, then plain functions, each by name
+        for method_name, method in sorted(methods) + sorted(functions):
+            endpoint = self._document_method(method, module_name, cls.__name__)
+            if endpoint:
+                endpoints.append(endpoint)
         
         return endpoints
     
@@ -168,9 +816,22 @@ class DocumentationGenerator:
     
     def _document_method(self, method, module_name: str, class_name: Optional[str] = None) -> Optional[APIEndpoint]:
         """Document a method or function."""
+        import inspect
+        
+        _empty = inspect.Parameter.empty
+        
         try:
-            signature = inspect.signature(method)
-            doc = inspect.getdoc(method)
+            # Inherited methods reach here once per subclass; unwrap bound
+            # methods so they share an entry with their underlying function
+            key = (getattr(method, '__func__', method), getattr(method, '__self__', None))
+            cached = self._sig_cache.get(key)
+            if cached is None:
+                # Undocumented callables are skipped, so check the docstring
+                # first and only then pay for the signature
+                doc = _cached_getdoc(method)
+                cached = (inspect.signature(method) if doc else None, doc)
+                self._sig_cache[key] = cached
+            signature, doc = cached
             
             if not doc:
                 return None
@@ -185,15 +846,15 @@ class DocumentationGenerator:
             for param_name, param in signature.parameters.items():
                 param_info = {
                     "name": param_name,
-                    "type": str(param.annotation) if param.annotation != param.empty else "Any",
-                    "default": str(param.default) if param.default != param.empty else None,
+                    "type": _format_annotation(param.annotation) if param.annotation is not _empty else "Any",
+                    "default": str(param.default) if param.default is not _empty else None,
                     "description": f"Parameter {param_name}"
                 }
                 parameters.append(param_info)
             
             # Extract return type
-            if signature.return_annotation != signature.empty:
-                returns["type"] = str(signature.return_annotation)
+            if signature.return_annotation is not _empty:
+                returns["type"] = _format_annotation(signature.return_annotation)
             
             return APIEndpoint(
                 name=method.__name__,
@@ -212,126 +873,120 @@ class DocumentationGenerator:
     
     def _write_module_documentation(self, module_doc: ModuleDocumentation) -> None:
         """Write module documentation to RST file."""
-        rst_content = self._generate_rst_content(module_doc)
-        
-        # Create file path
-        file_name = module_doc.name.replace(".", "_") + ".rst"
-        file_path = self.api_docs_dir / file_name
+        file_name = self._rst_file_name(module_doc.name)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(rst_content)
+        with self._open_in(self.api_docs_dir, file_name, buffering=1 << 16) as f:
+            self._write_rst_content(module_doc, f)
     
-    def _generate_rst_content(self, module_doc: ModuleDocumentation) -> str:
-        """Generate RST content for a module."""
-        lines = []
-        
+    def _write_rst_content(self, module_doc: ModuleDocumentation, fp) -> None:
+        """Stream a module's RST lines to an open file, newline-separated."""
+        lines = self._iter_rst_lines(module_doc)
+        fp.write(next(lines, ""))
+        fp.writelines("\n" + line for line in lines)
+    
+    def _iter_rst_lines(self, module_doc: ModuleDocumentation) -> Iterator[str]:
+        """Yield the RST content for a module line by line."""
         # Module title
         title = f"{module_doc.name} Module"
-        lines.append(title)
-        lines.append("=" * len(title))
-        lines.append("")
+        yield title
+        yield _underline("=", title)
+        yield ""
         
         # Module description
-        lines.append(module_doc.description)
-        lines.append("")
+        yield module_doc.description
+        yield ""
         
         # Classes section
         if module_doc.classes:
-            lines.append("Classes")
-            lines.append("-------")
-            lines.append("")
+            yield "Classes"
+            yield "-------"
+            yield ""
             
             for class_name in module_doc.classes:
-                lines.append(f".. autoclass:: {module_doc.name}.{class_name}")
-                lines.append("   :members:")
-                lines.append("   :undoc-members:")
-                lines.append("   :show-inheritance:")
-                lines.append("")
+                yield f".. autoclass:: {module_doc.name}.{class_name}"
+                yield "   :members:"
+                yield "   :undoc-members:"
+                yield "   :show-inheritance:"
+                yield ""
         
         # Functions section
         if module_doc.functions:
-            lines.append("Functions")
-            lines.append("---------")
-            lines.append("")
+            yield "Functions"
+            yield "---------"
+            yield ""
             
             for function_name in module_doc.functions:
-                lines.append(f".. autofunction:: {module_doc.name}.{function_name}")
-                lines.append("")
+                yield f".. autofunction:: {module_doc.name}.{function_name}"
+                yield ""
         
         # API Endpoints section
         if module_doc.endpoints:
-            lines.append("API Reference")
-            lines.append("-------------")
-            lines.append("")
+            yield "API Reference"
+            yield "-------------"
+            yield ""
             
             for endpoint in module_doc.endpoints:
-                lines.extend(self._format_endpoint_rst(endpoint))
-                lines.append("")
-        
-        return "\n".join(lines)
+                yield from self._format_endpoint_rst(endpoint)
+                yield ""
     
-    def _format_endpoint_rst(self, endpoint: APIEndpoint) -> List[str]:
-        """Format an endpoint as RST documentation."""
-        lines = []
-        
+    def _format_endpoint_rst(self, endpoint: APIEndpoint) -> Iterator[str]:
+        """Format an endpoint as RST documentation, one line at a time."""
         # Method/Function title
         if endpoint.class_name:
             full_name = f"{endpoint.class_name}.{endpoint.name}"
         else:
             full_name = endpoint.name
         
-        lines.append(f"{full_name}")
-        lines.append("^" * len(full_name))
-        lines.append("")
+        yield f"{full_name}"
+        yield _underline("^", full_name)
+        yield ""
         
         # Description
-        lines.append(endpoint.description)
-        lines.append("")
+        yield endpoint.description
+        yield ""
         
         # Parameters
         if endpoint.parameters:
-            lines.append("**Parameters:**")
-            lines.append("")
+            yield "**Parameters:**"
+            yield ""
             
-            for param in endpoint.parameters:
-                param_line = f"- **{param['name']}** (*{param['type']}*)"
-                if param['default']:
-                    param_line += f", default: {param['default']}"
-                param_line += f" - {param['description']}"
-                lines.append(param_line)
+            yield from [
+                f"- **{param['name']}** (*{param['type']}*)"
+                f"{', default: ' + param['default'] if param['default'] else ''}"
+                f" - {param['description']}"
+                for param in endpoint.parameters
+            ]
             
-            lines.append("")
+            yield ""
         
         # Returns
         if endpoint.returns['type'] != "Any":
-            lines.append("**Returns:**")
-            lines.append("")
-            lines.append(f"- *{endpoint.returns['type']}* - {endpoint.returns['description']}")
-            lines.append("")
+            yield "**Returns:**"
+            yield ""
+            yield f"- *{endpoint.returns['type']}* - {endpoint.returns['description']}"
+            yield ""
         
         # Raises
         if endpoint.raises:
-            lines.append("**Raises:**")
-            lines.append("")
+            yield "**Raises:**"
+            yield ""
             
             for exc in endpoint.raises:
-                lines.append(f"- **{exc['type']}** - {exc['description']}")
+                yield f"- **{exc['type']}** - {exc['description']}"
             
-            lines.append("")
+            yield ""
         
         # Examples
         if endpoint.examples:
-            lines.append("**Examples:**")
-            lines.append("")
+            yield "**Examples:**"
+            yield ""
             
             for example in endpoint.examples:
-                lines.append(".. code-block:: python")
-                lines.append("")
+                yield ".. code-block:: python"
+                yield ""
                 for line in example.split('\n'):
-                    lines.append(f"   {line}")
-                lines.append("")
-        
-        return lines
+                    yield f"   {line}"
+                yield ""
     
     def _generate_index_documentation(self, modules: List[str]) -> None:
         """Generate the main index documentation."""
@@ -393,262 +1048,20 @@ class DocumentationGenerator:
             "* :ref:`search`"
         ])
         
-        with open(self.docs_dir / "index.rst", 'w', encoding='utf-8') as f:
+        with self._open_in(self.docs_dir, "index.rst") as f:
             f.write("\n".join(lines))
     
     def _generate_config_documentation(self) -> None:
         """Generate configuration documentation."""
-        lines = [
-            "Configuration Guide",
-            "==================",
-            "",
-            "This guide explains how to configure the FPL Analytics application.",
-            "",
-            "Environment Variables", 
-            "-------------------",
-            "",
-            "The application uses the following environment variables:",
-            "",
-            "API Configuration",
-            "^^^^^^^^^^^^^^^^",
-            "",
-            "- ``FPL_API_URL``: Base URL for FPL API (default: https://fantasy.premierleague.com/api)",
-            "- ``FPL_API_TIMEOUT``: Request timeout in seconds (default: 30)",
-            "- ``FPL_API_RETRIES``: Number of retry attempts (default: 3)",
-            "",
-            "Cache Configuration",
-            "^^^^^^^^^^^^^^^^^",
-            "",
-            "- ``CACHE_TTL``: Cache time-to-live in seconds (default: 3600)",
-            "- ``REDIS_URL``: Redis connection URL for caching (optional)",
-            "",
-            "Security Configuration",
-            "^^^^^^^^^^^^^^^^^^^^",
-            "",
-            "- ``SECRET_KEY``: Application secret key (required for production)",
-            "- ``JWT_SECRET``: JWT signing secret (required for authentication)",
-            "- ``ENABLE_HTTPS``: Enable HTTPS (default: False)",
-            "",
-            "Example Configuration",
-            "-------------------",
-            "",
-            "Create a ``.env`` file in your project root:",
-            "",
-            ".. code-block:: bash",
-            "",
-            "   # API Configuration",
-            "   FPL_API_URL=https://fantasy.premierleague.com/api",
-            "   FPL_API_TIMEOUT=30",
-            "",
-            "   # Cache Configuration", 
-            "   CACHE_TTL=3600",
-            "   REDIS_URL=redis://localhost:6379/0",
-            "",
-            "   # Security (Production)",
-            "   SECRET_KEY=your-secret-key-here",
-            "   JWT_SECRET=your-jwt-secret-here",
-            "   ENABLE_HTTPS=true"
-        ]
-        
-        with open(self.docs_dir / "configuration.rst", 'w', encoding='utf-8') as f:
-            f.write("\n".join(lines))
+        with self._open_in(self.docs_dir, "configuration.rst") as f:
+            f.write(_CONFIG_RST)
     
     def _generate_user_guide(self) -> None:
         """Generate user guide documentation."""
-        lines = [
-            "User Guide",
-            "==========",
-            "",
-            "This guide provides step-by-step instructions for using the FPL Analytics application.",
-            "",
-            "Getting Started",
-            "---------------",
-            "",
-            "Installation",
-            "^^^^^^^^^^^",
-            "",
-            "1. Clone the repository:",
-            "",
-            ".. code-block:: bash",
-            "",
-            "   git clone https://github.com/your-username/fpl-analytics.git",
-            "   cd fpl-analytics",
-            "",
-            "2. Install dependencies:",
-            "",
-            ".. code-block:: bash",
-            "",
-            "   pip install -r requirements.txt",
-            "",
-            "3. Run the application:",
-            "",
-            ".. code-block:: bash",
-            "",
-            "   streamlit run main_modular.py",
-            "",
-            "Basic Usage",
-            "----------",
-            "",
-            "Dashboard Navigation",
-            "^^^^^^^^^^^^^^^^^^",
-            "",
-            "The application provides several main pages:",
-            "",
-            "- **Dashboard**: Overview of key FPL metrics and insights",
-            "- **Player Analysis**: Detailed analysis of individual players",
-            "- **Team Builder**: Tools for optimizing your FPL team",
-            "- **AI Recommendations**: Machine learning-powered player suggestions",
-            "",
-            "Data Services",
-            "^^^^^^^^^^^^",
-            "",
-            "The application uses several data services:",
-            "",
-            ".. code-block:: python",
-            "",
-            "   from services.enhanced_fpl_data_service import EnhancedFPLDataService",
-            "",
-            "   # Initialize service",
-            "   service = EnhancedFPLDataService()",
-            "",
-            "   # Test connection",
-            "   if service.test_connection():",
-            "       print('✅ Connected to FPL API')",
-            "",
-            "   # Get bootstrap data",
-            "   bootstrap_data = service.get_bootstrap_data()",
-            "",
-            "   # Convert to DataFrame",
-            "   players_df = service.get_players_dataframe()",
-            "",
-            "Advanced Features",
-            "---------------",
-            "",
-            "Real-time Updates",
-            "^^^^^^^^^^^^^^^",
-            "",
-            "Enable real-time data synchronization:",
-            "",
-            ".. code-block:: python",
-            "",
-            "   from features.realtime_sync import real_time_manager",
-            "",
-            "   # Start real-time sync",
-            "   real_time_manager.start_sync()",
-            "",
-            "   # Subscribe to updates",
-            "   def handle_price_changes(update):",
-            "       print(f'Price change: {update.data}')",
-            "",
-            "   real_time_manager.subscribe(UpdateType.PRICE_CHANGES, handle_price_changes)",
-            "",
-            "Machine Learning Analytics",
-            "^^^^^^^^^^^^^^^^^^^^^^^^",
-            "",
-            "Use ML models for player analysis:",
-            "",
-            ".. code-block:: python",
-            "",
-            "   from analytics.ml_engine import create_ml_analytics",
-            "",
-            "   # Create ML analytics instance",
-            "   ml_analytics = create_ml_analytics('xgboost')",
-            "",
-            "   # Train models",
-            "   model_results = ml_analytics.train_models(players_df)",
-            "",
-            "   # Make predictions",
-            "   predictions = ml_analytics.predict_player_performance(players_df)",
-            "",
-            "Troubleshooting",
-            "--------------",
-            "",
-            "Common Issues",
-            "^^^^^^^^^^^",
-            "",
-            "**SSL Certificate Errors**",
-            "",
-            "If you encounter SSL certificate errors, the application automatically",
-            "handles this by disabling SSL verification for the FPL API.",
-            "",
-            "**Cache Issues**",
-            "",
-            "To clear the cache:",
-            "",
-            ".. code-block:: python",
-            "",
-            "   from utils.advanced_cache_manager import get_cache_manager",
-            "",
-            "   cache_manager = get_cache_manager()",
-            "   cache_manager.clear()",
-            "",
-            "**Performance Issues**",
-            "",
-            "Monitor performance using the built-in performance monitor:",
-            "",
-            ".. code-block:: python",
-            "",
-            "   from utils.enhanced_performance_monitor import get_performance_monitor",
-            "",
-            "   monitor = get_performance_monitor()",
-            "   metrics = monitor.get_metrics()",
-            "   print(metrics)"
-        ]
-        
-        with open(self.docs_dir / "user_guide.rst", 'w', encoding='utf-8') as f:
-            f.write("\n".join(lines))
+        with self._open_in(self.docs_dir, "user_guide.rst") as f:
+            f.write(_USER_GUIDE_RST)
     
     def generate_sphinx_config(self) -> None:
         """Generate Sphinx configuration file."""
-        config_content = '''# Configuration file for the Sphinx documentation builder.
-
-# -- Project information -----------------------------------------------------
-project = 'FPL Analytics'
-copyright = '2025, FPL Analytics Team'
-author = 'FPL Analytics Team'
-release = '1.0.0'
-
-# -- General configuration ---------------------------------------------------
-extensions = [
-    'sphinx.ext.autodoc',
-    'sphinx.ext.viewcode',
-    'sphinx.ext.napoleon',
-    'sphinx.ext.intersphinx',
-    'sphinx.ext.todo',
-    'sphinx.ext.coverage',
-    'sphinx.ext.mathjax',
-]
-
-templates_path = ['_templates']
-exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
-
-# -- Options for HTML output -------------------------------------------------
-html_theme = 'sphinx_rtd_theme'
-html_static_path = ['_static']
-
-# -- Extension configuration -------------------------------------------------
-# Napoleon settings
-napoleon_google_docstring = True
-napoleon_numpy_docstring = True
-napoleon_include_init_with_doc = False
-napoleon_include_private_with_doc = False
-
-# Autodoc settings
-autodoc_default_options = {
-    'members': True,
-    'member-order': 'bysource',
-    'special-members': '__init__',
-    'undoc-members': True,
-    'exclude-members': '__weakref__'
-}
-
-# Intersphinx mapping
-intersphinx_mapping = {
-    'python': ('https://docs.python.org/3/', None),
-    'pandas': ('https://pandas.pydata.org/docs/', None),
-    'numpy': ('https://numpy.org/doc/stable/', None),
-}
-'''
-        
-        with open(self.docs_dir / "conf.py", 'w', encoding='utf-8') as f:
-            f.write(config_content)
\ No newline at end of file
+        with self._open_in(self.docs_dir, "conf.py") as f:
+            f.write(_SPHINX_CONF_PY)
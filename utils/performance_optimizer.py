@@ -22,7 +22,8 @@ class PerformanceOptimizer:
         
         Args:
             ttl: Time to live in seconds (default: 5 minutes)
-            hash_funcs: Ignored, kept for compatibility
+            hash_funcs: Optional mapping of argument type to a function that
+                returns a cheap cache key for arguments of that type
         """
         def decorator(func: Callable) -> Callable:
             @wraps(func)
@@ -32,6 +33,9 @@ class PerformanceOptimizer:
                     # Try to create a hash from serializable args
                     serializable_args = []
                     for arg in args:
+                        if hash_funcs and type(arg) in hash_funcs:
+                            serializable_args.append(str(hash_funcs[type(arg)](arg)))
+                            continue
                         # Skip service instances and other complex objects
                         if hasattr(arg, '__dict__') and hasattr(arg, '__class__'):
                             continue
@@ -20,16 +20,20 @@ class InjuryTransferPage:
         st.title("⚕️ Injury & Transfer Centre")
         st.markdown("*Real-time updates from Premier League Official*")
         
+        # Both tabs render on every run, so fetch their data in parallel
+        with st.spinner("Fetching latest injury and transfer data..."):
+            injuries, transfers = self.external_service.fetch_all()
+        
         # Create tabs for injuries and transfers
         tab1, tab2 = st.tabs(["🏥 Injuries", "🔄 Transfers"])
         
         with tab1:
-            self._render_injuries()
+            self._render_injuries(injuries)
         
         with tab2:
-            self._render_transfers()
+            self._render_transfers(transfers)
     
-    def _render_injuries(self):
+    def _render_injuries(self, injuries):
         """Render injury data section"""
         st.markdown("### 🏥 Latest Player Injuries")
         st.markdown("*Data sourced from Premier League Official Website*")
@@ -40,12 +44,9 @@ class InjuryTransferPage:
             if st.button("🔄 Refresh Data", key="refresh_injuries"):
                 # Clear cache to force refresh
                 self.external_service.injury_data_cache = None
-                self.external_service.cache_timestamp = None
+                self.external_service.injury_cache_ts = None
                 st.rerun()
         
-        with st.spinner("Fetching latest injury data..."):
-            injuries = self.external_service.fetch_premier_league_injuries()
-        
         if injuries:
             # Display summary metrics
             col1, col2, col3 = st.columns(3)
@@ -133,7 +134,7 @@ class InjuryTransferPage:
             
             st.markdown("**Data Source:** [Premier League Injuries](https://www.premierleague.com/en/latest-player-injuries)")
     
-    def _render_transfers(self):
+    def _render_transfers(self, transfers):
         """Render transfer data section"""
         st.markdown("### 🔄 Latest Transfers")
         st.markdown("*Data sourced from Premier League Official Website*")
@@ -144,12 +145,9 @@ class InjuryTransferPage:
             if st.button("🔄 Refresh Data", key="refresh_transfers"):
                 # Clear cache to force refresh
                 self.external_service.transfer_data_cache = None
-                self.external_service.cache_timestamp = None
+                self.external_service.transfer_cache_ts = None
                 st.rerun()
         
-        with st.spinner("Fetching latest transfer data..."):
-            transfers = self.external_service.fetch_premier_league_transfers()
-        
         if transfers:
             # Display summary metrics
             col1, col2, col3 = st.columns(3)